@@ -24,10 +24,14 @@ from .config import (
 
 from .engine import (
     schedule_period,
+    prepare_people,
     schedule_weekday_mercy,
     schedule_weekend_mercy,
     schedule_ir_weekday,
+    schedule_profile,
+    SHIFT_PROFILES,
     calculate_fairness_metrics,
+    calculate_fairness_metrics_batch,
 )
 
 __all__ = [
@@ -43,8 +47,12 @@ __all__ = [
     "IR_WEEKDAY_CONFIG",
     "DEFAULT_SHIFT_DEFINITIONS",
     "schedule_period",
+    "prepare_people",
     "schedule_weekday_mercy",
     "schedule_weekend_mercy",
     "schedule_ir_weekday",
+    "schedule_profile",
+    "SHIFT_PROFILES",
     "calculate_fairness_metrics",
+    "calculate_fairness_metrics_batch",
 ]
@@ -9,13 +9,34 @@ unquoted values (e.g.  neuro,cardiac,nm,MRI,Gen).
 Old format was space-separated quoted strings — now normalized.
 """
 
+import copy
 import json
 import logging
 import math
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    def json_loads(raw: bytes) -> Any:
+        """Parse JSON bytes (orjson when installed)."""
+        return orjson.loads(raw)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes (orjson when installed)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:   # optional speedup — stdlib json fallback
+    def json_loads(raw: bytes) -> Any:
+        """Parse JSON bytes (orjson when installed)."""
+        return json.loads(raw)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes (orjson when installed)."""
+        return json.dumps(obj, indent=2).encode()
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -96,13 +117,25 @@ def load_roster(
       subspecialties, notes (optional)
 
     Returns sorted list of dicts (sorted by index).
-    """
-    import pandas as pd
 
+    Parsed rosters are cached per (path, mtime, size), so repeated loads in
+    one process skip the CSV parse until the file changes. Each call gets
+    its own copy.
+    """
     path = roster_path or DEFAULT_ROSTER_PATH
     if not path.exists():
         raise FileNotFoundError(f"Roster file not found: {path}")
+    st = path.stat()
+    return copy.deepcopy(_load_roster_cached(str(path), st.st_mtime_ns, st.st_size))
+
 
+@lru_cache(maxsize=4)
+def _load_roster_cached(path_str: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse roster_key.csv; cache key includes mtime/size so edits invalidate it."""
+    import numpy as np
+    import pandas as pd
+
+    path = Path(path_str)
     df = pd.read_csv(path)
 
     people: List[Dict[str, Any]] = []
@@ -157,10 +190,10 @@ def load_roster(
     people.sort(key=lambda p: p["index"])
 
     # Validate
-    indices = [p["index"] for p in people]
-    if indices != list(range(len(people))):
+    indices = np.fromiter((p["index"] for p in people), dtype=np.int32, count=len(people))
+    if not np.array_equal(indices, np.arange(len(people), dtype=np.int32)):
         raise ValueError(
-            f"Roster indices must be 0..{len(people)-1}. Got: {indices}. "
+            f"Roster indices must be 0..{len(people)-1}. Got: {indices.tolist()}. "
             "Check roster_key.csv for gaps or duplicate index values."
         )
 
@@ -179,14 +212,23 @@ def load_vacation_map(
     Load vacation map from vacation_map.csv.
 
     Returns: {date_str: [unavailable_names]}
-    """
-    import pandas as pd
 
+    Cached like load_roster (per path, mtime and size; copy per call).
+    """
     path = vacation_path or DEFAULT_VACATION_PATH
     if not path.exists():
         logger.warning(f"Vacation map not found: {path}. Returning empty map.")
         return {}
+    st = path.stat()
+    return copy.deepcopy(_load_vacation_map_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_vacation_map_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, List[str]]:
+    """Parse vacation_map.csv; cache key includes mtime/size so edits invalidate it."""
+    import pandas as pd
 
+    path = Path(path_str)
     df = pd.read_csv(path)
     vacation_map: Dict[str, List[str]] = {}
 
@@ -215,8 +257,7 @@ def load_cursor_state(
     if not path.exists():
         logger.warning(f"Cursor state not found: {path}. Starting from 0.")
         return {}
-    with open(path) as f:
-        data = json.load(f)
+    data = json_loads(path.read_bytes())
     # Remove metadata keys
     return {k: float(v) for k, v in data.items()
             if k not in ("last_updated", "notes") and isinstance(v, (int, float))}
@@ -232,8 +273,7 @@ def save_cursor_state(
     path.parent.mkdir(parents=True, exist_ok=True)
     data = {k: round(v, 4) for k, v in cursor_state.items()}
     data["last_updated"] = _date.today().isoformat()
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    path.write_bytes(json_dumps(data))
     logger.info(f"Cursor state saved to {path}: {data}")
 
 
@@ -16,9 +16,14 @@ Usage:
 """
 
 import argparse
+import heapq
 import logging
 import sys
+import threading
+from collections import Counter
+from dataclasses import replace
 from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -27,6 +32,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import (
+    json_dumps,
     load_roster,
     load_vacation_map,
     load_cursor_state,
@@ -36,9 +42,8 @@ from src.config import (
 from src.engine import (
     schedule_blocks,
     calculate_fairness_metrics,
-    get_weekday_dates,
-    get_saturday_dates,
-    get_weekend_dates,
+    update_fairness_metrics,
+    get_date_lists,
 )
 from src.constraints import ConstraintChecker, ConstraintSeverity
 from src.exporter import export_to_csv, export_to_excel, export_fairness_report
@@ -49,19 +54,45 @@ logger = logging.getLogger(__name__)
 
 OUTPUTS_DIR = PROJECT_ROOT / "outputs"
 
+# Export file suffixes, joined onto "{output_dir}/{prefix}_" once per run
+_OUTPUT_SUFFIXES = {
+    "csv":           "schedule.csv",
+    "excel":         "schedule.xlsx",
+    "report":        "fairness_report.txt",
+    "violations":    "violations.txt",
+    "fairness_data": "fairness_data.json",
+}
+
 
 # ---------------------------------------------------------------------------
 # Visual analysis (matplotlib) — reference: scripts/analyze_schedule.py
 # ---------------------------------------------------------------------------
 
+def _warm_matplotlib() -> None:
+    """Import matplotlib/pyplot with the Agg backend (font cache, backend init)."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot  # noqa: F401
+    except ImportError:
+        pass   # _generate_visual_analysis logs the missing dependency
+
+
 def _generate_visual_analysis(
     schedule: Dict,
     metrics: Dict,
     roster: List,
     output_dir: Path,
     prefix: str,
+    separate_files: bool = False,
 ) -> None:
-    """Generate matplotlib charts for dry_run schedule (shift/hours distribution, deviation, task breakdown)."""
+    """
+    Generate matplotlib charts for dry_run schedule (shift/hours distribution,
+    deviation, task breakdown).
+
+    By default all panels go into one figure saved once as
+    {prefix}_analysis.png; separate_files=True writes the four legacy PNGs.
+    """
     try:
         import matplotlib
         matplotlib.use("Agg")
@@ -81,79 +112,81 @@ def _generate_visual_analysis(
     cv_pct = metrics.get("cv", 0)
     hours_cv = metrics.get("hours_cv", 0)
 
+    import numpy as np
+
     staff_sorted = sorted(names, key=lambda n: rc.get(n, 0), reverse=True)
     shifts = [rc.get(n, 0) for n in staff_sorted]
     hours = [hc.get(n, 0) for n in staff_sorted]
     x = range(len(staff_sorted))
 
+    # Band colouring (above / below mean ± 1 SD) as array masks
+    shift_arr = np.asarray(shifts, dtype=float)
+    hours_arr = np.asarray(hours, dtype=float)
+    colors = np.where(
+        shift_arr > mean_val + std_val, "#b22222",
+        np.where(shift_arr < mean_val - std_val, "#1a3d7c", "#4a90d9"),
+    ).tolist()
+    hcolors = np.where(
+        hours_arr > hours_mean + hours_std, "#b22222",
+        np.where(hours_arr < hours_mean - hours_std, "#1a3d7c", "#2e8b57"),
+    ).tolist()
+    deviations = shift_arr - mean_val
+    dcolors = np.where(deviations >= 0, "#b22222", "#1a3d7c").tolist()
+
+    # Task breakdown data (top 15 shifts by assignment count)
+    shift_counts = Counter(
+        shift_name
+        for assignments in schedule.values()
+        for shift_name, person_name in assignments
+        if person_name != "UNFILLED"
+    )
+    sorted_shifts = shift_counts.most_common(15)
+
     # Chart 1: Shift distribution
-    fig, ax = plt.subplots(figsize=(13, 5))
-    colors = ["#b22222" if s > mean_val + std_val else "#1a3d7c" if s < mean_val - std_val else "#4a90d9" for s in shifts]
-    ax.bar(x, shifts, color=colors, alpha=0.85, width=0.65)
-    ax.axhline(mean_val, color="crimson", linewidth=1.8, linestyle="--", label=f"Mean: {mean_val:.1f}")
-    ax.axhline(mean_val + std_val, color="orange", linewidth=1, linestyle=":")
-    ax.axhline(mean_val - std_val, color="orange", linewidth=1, linestyle=":")
-    for bar, val in zip(ax.patches, shifts):
-        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.4, str(val), ha="center", va="bottom", fontsize=8)
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
-    ax.set_ylabel("Shift Count")
-    ax.set_title(f"Shift Distribution by Staff (dry_run)\nCV = {cv_pct:.1f}%", fontsize=13, fontweight="bold")
-    ax.legend()
-    ax.grid(axis="y", alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(out / f"{prefix}_shift_distribution.png", dpi=150)
-    plt.close(fig)
-    print(f"  ✓ Visual  → {prefix}_shift_distribution.png")
+    def _chart_shift(ax) -> None:
+        ax.bar(x, shifts, color=colors, alpha=0.85, width=0.65)
+        ax.axhline(mean_val, color="crimson", linewidth=1.8, linestyle="--", label=f"Mean: {mean_val:.1f}")
+        ax.axhline(mean_val + std_val, color="orange", linewidth=1, linestyle=":")
+        ax.axhline(mean_val - std_val, color="orange", linewidth=1, linestyle=":")
+        for bar, val in zip(ax.patches, shifts):
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.4, str(val), ha="center", va="bottom", fontsize=8)
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
+        ax.set_ylabel("Shift Count")
+        ax.set_title(f"Shift Distribution by Staff (dry_run)\nCV = {cv_pct:.1f}%", fontsize=13, fontweight="bold")
+        ax.legend()
+        ax.grid(axis="y", alpha=0.3)
 
     # Chart 2: Hours distribution
-    fig, ax = plt.subplots(figsize=(13, 5))
-    hcolors = ["#b22222" if h > hours_mean + hours_std else "#1a3d7c" if h < hours_mean - hours_std else "#2e8b57" for h in hours]
-    ax.bar(x, hours, color=hcolors, alpha=0.85, width=0.65)
-    ax.axhline(hours_mean, color="crimson", linewidth=1.8, linestyle="--", label=f"Mean: {hours_mean:.1f} hrs")
-    ax.axhline(hours_mean + hours_std, color="orange", linewidth=1, linestyle=":")
-    ax.axhline(hours_mean - hours_std, color="orange", linewidth=1, linestyle=":")
-    for bar, val in zip(ax.patches, hours):
-        ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 1, f"{val:.0f}", ha="center", va="bottom", fontsize=8)
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
-    ax.set_ylabel("Total Hours Assigned")
-    ax.set_title(f"Hours-Assigned Distribution by Staff (dry_run)\nCV = {hours_cv:.1f}%", fontsize=13, fontweight="bold")
-    ax.legend()
-    ax.grid(axis="y", alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(out / f"{prefix}_hours_distribution.png", dpi=150)
-    plt.close(fig)
-    print(f"  ✓ Visual  → {prefix}_hours_distribution.png")
+    def _chart_hours(ax) -> None:
+        ax.bar(x, hours, color=hcolors, alpha=0.85, width=0.65)
+        ax.axhline(hours_mean, color="crimson", linewidth=1.8, linestyle="--", label=f"Mean: {hours_mean:.1f} hrs")
+        ax.axhline(hours_mean + hours_std, color="orange", linewidth=1, linestyle=":")
+        ax.axhline(hours_mean - hours_std, color="orange", linewidth=1, linestyle=":")
+        for bar, val in zip(ax.patches, hours):
+            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 1, f"{val:.0f}", ha="center", va="bottom", fontsize=8)
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
+        ax.set_ylabel("Total Hours Assigned")
+        ax.set_title(f"Hours-Assigned Distribution by Staff (dry_run)\nCV = {hours_cv:.1f}%", fontsize=13, fontweight="bold")
+        ax.legend()
+        ax.grid(axis="y", alpha=0.3)
 
     # Chart 3: Shift deviation from mean
-    deviations = [s - mean_val for s in shifts]
-    fig, ax = plt.subplots(figsize=(13, 4))
-    ax.bar(x, deviations, color=["#b22222" if d >= 0 else "#1a3d7c" for d in deviations], alpha=0.8, width=0.65)
-    ax.axhline(0, color="black", linewidth=1)
-    ax.axhline(std_val, color="orange", linewidth=1, linestyle="--", label="±1 SD")
-    ax.axhline(-std_val, color="orange", linewidth=1, linestyle="--")
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
-    ax.set_ylabel("Deviation from Mean Shifts")
-    ax.set_title("Shift Deviation from Mean (dry_run)", fontsize=13, fontweight="bold")
-    ax.legend()
-    ax.grid(axis="y", alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(out / f"{prefix}_shift_deviation.png", dpi=150)
-    plt.close(fig)
-    print(f"  ✓ Visual  → {prefix}_shift_deviation.png")
-
-    # Chart 4: Task breakdown (top 15 shifts by assignment count)
-    shift_counts: Dict[str, int] = {}
-    for _date, assignments in schedule.items():
-        for shift_name, person_name in assignments:
-            if person_name == "UNFILLED":
-                continue
-            shift_counts[shift_name] = shift_counts.get(shift_name, 0) + 1
-    sorted_shifts = sorted(shift_counts.items(), key=lambda x: x[1], reverse=True)[:15]
-    if sorted_shifts:
-        fig, ax = plt.subplots(figsize=(10, 6))
+    def _chart_dev(ax) -> None:
+        ax.bar(x, deviations, color=dcolors, alpha=0.8, width=0.65)
+        ax.axhline(0, color="black", linewidth=1)
+        ax.axhline(std_val, color="orange", linewidth=1, linestyle="--", label="±1 SD")
+        ax.axhline(-std_val, color="orange", linewidth=1, linestyle="--")
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(staff_sorted, rotation=40, ha="right", fontsize=9)
+        ax.set_ylabel("Deviation from Mean Shifts")
+        ax.set_title("Shift Deviation from Mean (dry_run)", fontsize=13, fontweight="bold")
+        ax.legend()
+        ax.grid(axis="y", alpha=0.3)
+
+    # Chart 4: Task breakdown
+    def _chart_tasks(ax) -> None:
         labels = [s[0] for s in reversed(sorted_shifts)]
         vals = [s[1] for s in reversed(sorted_shifts)]
         ax.barh(labels, vals, color="#4a90d9", alpha=0.85)
@@ -162,10 +195,63 @@ def _generate_visual_analysis(
         ax.set_xlabel("Assignment Count")
         ax.set_title("Top 15 Task Types (dry_run)", fontsize=13, fontweight="bold")
         ax.grid(axis="x", alpha=0.3)
-        fig.tight_layout()
-        fig.savefig(out / f"{prefix}_task_breakdown.png", dpi=150)
-        plt.close(fig)
-        print(f"  ✓ Visual  → {prefix}_task_breakdown.png")
+
+    # (suffix, figsize, draw) per panel
+    panels = [
+        ("shift_distribution", (13, 5), _chart_shift),
+        ("hours_distribution", (13, 5), _chart_hours),
+        ("shift_deviation", (13, 4), _chart_dev),
+    ]
+    if sorted_shifts:
+        panels.append(("task_breakdown", (10, 6), _chart_tasks))
+
+    if separate_files:
+        for suffix, figsize, draw in panels:
+            fig, ax = plt.subplots(figsize=figsize)
+            draw(ax)
+            fig.tight_layout()
+            fig.savefig(out / f"{prefix}_{suffix}.png", dpi=150)
+            plt.close(fig)
+            print(f"  ✓ Visual  → {prefix}_{suffix}.png")
+        return
+
+    # One figure, one savefig: panels stacked with their legacy relative heights
+    heights = [figsize[1] for _, figsize, _ in panels]
+    fig, axes = plt.subplots(
+        nrows=len(panels), figsize=(13, sum(heights)),
+        gridspec_kw={"height_ratios": heights},
+    )
+    for ax, (_, _, draw) in zip(axes, panels):
+        draw(ax)
+    fig.tight_layout()
+    fig.savefig(out / f"{prefix}_analysis.png", dpi=150)
+    plt.close(fig)
+    print(f"  ✓ Visual  → {prefix}_analysis.png")
+
+
+# ---------------------------------------------------------------------------
+# Export helpers (step 6)
+# ---------------------------------------------------------------------------
+
+def _write_fairness_json(metrics: Dict, path: Path) -> None:
+    """Fairness JSON (hours-assigned CV for programmatic fairness/balance checks)."""
+    path.write_bytes(json_dumps({
+        "weighted_cv": metrics.get("cv", 0),
+        "hours_mean": metrics.get("hours_mean", 0),
+        "hours_std": metrics.get("hours_std", 0),
+        "hours_cv": metrics.get("hours_cv", 0),
+        "hours_counts": {k: round(v, 1) for k, v in (metrics.get("hours_counts") or {}).items()},
+        "unfilled": metrics.get("unfilled", 0),
+    }))
+
+
+def _write_violations_report(path: Path, hard_violations: List, soft_violations: List) -> None:
+    """Violations report (built in memory, written with one call)."""
+    lines = ["=== Constraint Violations ===", "", f"HARD ({len(hard_violations)}):"]
+    lines += [f"  {v}" for v in hard_violations]
+    lines += ["", f"SOFT ({len(soft_violations)}):"]
+    lines += [f"  {v}" for v in soft_violations]
+    path.write_text("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -180,6 +266,9 @@ def run_dry_run(
     save_cursors: bool = False,
     visual: bool = False,
     nc_week_anchor: Optional[date] = None,
+    visual_separate: bool = False,
+    roster: Optional[List[Dict[str, Any]]] = None,
+    vacation_map: Optional[Dict[str, List[str]]] = None,
 ) -> Dict:
     """
     Generate full schedule in dry-run mode (never pushes to QGenda).
@@ -193,6 +282,10 @@ def run_dry_run(
         nc_week_anchor:  A Monday that is a known NC week; enables 2-week cycle
                          logic in the engine.  Defaults to 2026-03-02 (first Mon
                          of real schedule = NC week).
+        visual_separate: With visual, write one PNG per chart instead of a
+                         single combined {prefix}_analysis.png
+        roster:          Pre-loaded roster (batch callers); loaded from disk if None
+        vacation_map:    Pre-loaded vacation map; loaded from disk if None
 
     Returns:
         Dict with schedule, metrics, violations, output paths
@@ -204,6 +297,12 @@ def run_dry_run(
     prefix = f"dry_run_{start_date}_{end_date}"
     sep = "=" * 70
 
+    # matplotlib's import is slow; overlap it with scheduling when charts are wanted
+    mpl_ready: Optional[threading.Thread] = None
+    if visual:
+        mpl_ready = threading.Thread(target=_warm_matplotlib, daemon=True)
+        mpl_ready.start()
+
     print(f"\n{sep}")
     print(f"  DRY RUN MODE — No data pushed to QGenda")
     print(f"  Period: {start_date} → {end_date}")
@@ -211,8 +310,10 @@ def run_dry_run(
 
     # ── 1. Load configuration ──────────────────────────────────────────────
     print("Step 1/6: Loading configuration...")
-    roster         = load_roster()
-    vacation_map   = load_vacation_map()
+    if roster is None:
+        roster = load_roster()
+    if vacation_map is None:
+        vacation_map = load_vacation_map()
     cursor_state   = load_cursor_state()
     print(f"  ✓ {len(roster)} radiologists | {len(vacation_map)} vacation dates | cursors: {cursor_state}")
 
@@ -246,10 +347,8 @@ def run_dry_run(
 
     # ── 3. Build date lists ────────────────────────────────────────────────
     print("\nStep 3/6: Building date lists...")
-    weekday_dates  = get_weekday_dates(start_date, end_date)
-    saturday_dates = get_saturday_dates(start_date, end_date)
-    weekend_dates  = get_weekend_dates(start_date, end_date)
-    sat_strs       = [d.isoformat() for d in saturday_dates]
+    weekday_dates, saturday_dates, weekend_dates = get_date_lists(start_date, end_date)
+    sat_strs       = [d.isoformat() for d in saturday_dates] if saturday_dates else None
     print(f"  ✓ {len(weekday_dates)} weekdays | {len(saturday_dates)} weekends ({len(weekend_dates)} Sat+Sun days)")
 
     # ── 4. Block scheduling ────────────────────────────────────────────────
@@ -266,7 +365,7 @@ def run_dry_run(
         nc_week_anchor=nc_week_anchor,
     )
 
-    total_assignments = sum(len(v) for v in full_schedule.values())
+    total_assignments = sum(map(len, full_schedule.values()))
     print(f"  ✓ {total_assignments} total assignments across {len(full_schedule)} dates")
 
     if save_cursors:
@@ -283,11 +382,14 @@ def run_dry_run(
             roster,
             vacation_map,
             checker,
-            weekend_dates=sat_strs or None,
+            weekend_dates=sat_strs,
             output_dir=output_dir,
             prefix=prefix,
         )
-        metrics = calculate_fairness_metrics(full_schedule, roster)
+        metrics = update_fairness_metrics(
+            metrics, roster,
+            [(r["task"], r["staff"]) for r in repair_result.get("repaired", [])],
+        )
         for r in repair_result.get("repaired", []):
             if r.get("tier") == 4:
                 relaxed_repairs.add((r["date"], r["task"], r["staff"]))
@@ -297,7 +399,7 @@ def run_dry_run(
 
     hard_violations, soft_violations = checker.check_all(
         schedule=full_schedule,
-        weekend_dates=sat_strs or None,
+        weekend_dates=sat_strs,
         metrics=metrics,
         pool_label="Full Schedule",
     )
@@ -312,9 +414,11 @@ def run_dry_run(
                 v.constraint_type == "SUBSPECIALTY_MISMATCH"
                 and (v.date, v.shift, v.staff) in relaxed_repairs
             ):
-                v.severity = ConstraintSeverity.SOFT
-                v.description = f"[REPAIR FALLBACK] {v.description}"
-                downgraded.append(v)
+                downgraded.append(replace(
+                    v,
+                    severity=ConstraintSeverity.SOFT,
+                    template="[REPAIR FALLBACK] " + v.template,
+                ))
             else:
                 kept_hard.append(v)
         hard_violations = kept_hard
@@ -322,34 +426,41 @@ def run_dry_run(
         if downgraded:
             print(f"  ℹ Downgraded {len(downgraded)} subspecialty mismatches (repair fallback)")
 
-    h_count = len(hard_violations)
-    s_count = len(soft_violations)
-    cv_pct  = metrics["cv"]
-    status  = "✓" if h_count == 0 else "✗"
-    cv_icon = "✓" if cv_pct < 10.0 else "✗"
+    # Report values: computed once here, reused by the summary block
+    h_count  = len(hard_violations)
+    s_count  = len(soft_violations)
+    cv_pct   = metrics["cv"]
+    hours_cv = metrics.get("hours_cv", 0)
+    status   = "✓" if h_count == 0 else "✗"
+    cv_icon  = "✓" if cv_pct < 10.0 else "✗"
+    hcv_icon = "✓" if hours_cv < 10.0 else "✗"
 
     print(f"  {status} Hard violations: {h_count}")
     print(f"    Soft violations: {s_count}")
     print(f"  {cv_icon} Weighted CV: {cv_pct:.2f}% (target <10%)")
-    hours_cv = metrics.get("hours_cv", 0)
-    hcv_icon = "✓" if hours_cv < 10.0 else "✗"
     print(f"  {hcv_icon} Hours-assigned CV: {hours_cv:.2f}% (target <10%)")
 
     # ── 6. Export ──────────────────────────────────────────────────────────
     print("\nStep 6/6: Exporting outputs...")
 
-    csv_path        = output_dir / f"{prefix}_schedule.csv"
-    xlsx_path       = output_dir / f"{prefix}_schedule.xlsx"
-    report_path     = output_dir / f"{prefix}_fairness_report.txt"
-    violations_path = output_dir / f"{prefix}_violations.txt"
+    paths = {
+        key: output_dir / f"{prefix}_{suffix}"
+        for key, suffix in _OUTPUT_SUFFIXES.items()
+    }
+    csv_path           = paths["csv"]
+    xlsx_path          = paths["excel"]
+    report_path        = paths["report"]
+    violations_path    = paths["violations"]
+    fairness_data_path = paths["fairness_data"]
+    name_to_initials = {p["name"]: p["initials"] for p in roster}
 
     export_to_csv(full_schedule, csv_path, include_shift=True)
-    name_to_initials = {p["name"]: p["initials"] for p in roster}
     export_to_excel(
         full_schedule, xlsx_path, pivot=True,
         shift_order=["IR-1", "IR-2", "M0", "M1", "M2", "M3",
                      "M0_WEEKEND", "EP", "LP", "Dx-CALL"],
         name_to_initials=name_to_initials,
+        engine="xlsxwriter",
     )
     export_fairness_report(
         metrics, report_path,
@@ -359,28 +470,10 @@ def run_dry_run(
     )
 
     # Fairness JSON (hours-assigned CV for programmatic fairness/balance checks)
-    import json
-    fairness_data_path = output_dir / f"{prefix}_fairness_data.json"
-    with open(fairness_data_path, "w") as f:
-        json.dump({
-            "weighted_cv": metrics.get("cv", 0),
-            "hours_mean": metrics.get("hours_mean", 0),
-            "hours_std": metrics.get("hours_std", 0),
-            "hours_cv": metrics.get("hours_cv", 0),
-            "hours_counts": {k: round(v, 1) for k, v in (metrics.get("hours_counts") or {}).items()},
-            "unfilled": metrics.get("unfilled", 0),
-        }, f, indent=2)
+    _write_fairness_json(metrics, fairness_data_path)
     print(f"  ✓ Fairness JSON: {fairness_data_path.name} (includes hours-assigned CV)")
 
-    # Violations report
-    with open(violations_path, "w") as f:
-        f.write("=== Constraint Violations ===\n\n")
-        f.write(f"HARD ({h_count}):\n")
-        for v in hard_violations:
-            f.write(f"  {v}\n")
-        f.write(f"\nSOFT ({s_count}):\n")
-        for v in soft_violations:
-            f.write(f"  {v}\n")
+    _write_violations_report(violations_path, hard_violations, soft_violations)
 
     print(f"  ✓ CSV:       {csv_path.name}")
     print(f"  ✓ Excel:     {xlsx_path.name}")
@@ -399,22 +492,32 @@ def run_dry_run(
     print(f"  Hard violations:   {h_count}  {status}")
     print(f"  Soft violations:   {s_count}")
 
+    # Each block below is joined and printed with one write
     wc = metrics["weighted_counts"]
-    sorted_wc = sorted(wc.items(), key=lambda x: x[1], reverse=True)
-    print(f"\n  Top 3 assigned (weighted):")
-    for name, val in sorted_wc[:3]:
-        print(f"    {name:<24} {val:.2f}")
-    print(f"\n  Bottom 3 assigned (weighted):")
-    for name, val in sorted_wc[-3:][::-1]:
-        print(f"    {name:<24} {val:.2f}")
-
-    print(f"\n  Per-shift CV:")
-    for shift, cv_val in sorted(metrics.get("per_shift_cv", {}).items()):
-        icon = "✓" if cv_val < 10.0 else "✗"
-        print(f"    {shift:<16} {cv_val:6.2f}%  {icon}")
+    top = heapq.nlargest(3, wc.items(), key=itemgetter(1))
+    # reversed(): ties list latest-inserted first, as the old sort's tail did
+    bottom = heapq.nsmallest(3, reversed(wc.items()), key=itemgetter(1))
+    print("\n".join([
+        "\n  Top 3 assigned (weighted):",
+        *(f"    {name:<24} {val:.2f}" for name, val in top),
+        "\n  Bottom 3 assigned (weighted):",
+        *(f"    {name:<24} {val:.2f}" for name, val in bottom),
+    ]))
+
+    print("\n".join([
+        "\n  Per-shift CV:",
+        *(
+            f"    {shift:<16} {cv_val:6.2f}%  {'✓' if cv_val < 10.0 else '✗'}"
+            for shift, cv_val in sorted(metrics.get("per_shift_cv", {}).items())
+        ),
+    ]))
 
     if visual:
-        _generate_visual_analysis(full_schedule, metrics, roster, output_dir, prefix)
+        mpl_ready.join()
+        _generate_visual_analysis(
+            full_schedule, metrics, roster, output_dir, prefix,
+            separate_files=visual_separate,
+        )
 
     print(f"\n{sep}\n")
 
@@ -425,10 +528,7 @@ def run_dry_run(
         "soft_violations": soft_violations,
         "cursor_state":    cursor_state,
         "outputs": {
-            "csv":        csv_path,
-            "excel":      xlsx_path,
-            "report":     report_path,
-            "violations": violations_path,
+            key: paths[key] for key in ("csv", "excel", "report", "violations")
         },
     }
     return result
@@ -452,6 +552,11 @@ def main():
         action="store_true",
         help="Generate matplotlib charts (shift/hours distribution, deviation, task breakdown). Reference: scripts/analyze_schedule.py",
     )
+    parser.add_argument(
+        "--visual-separate",
+        action="store_true",
+        help="With --visual: write one PNG per chart instead of a single combined analysis PNG",
+    )
     parser.add_argument(
         "--nc-week-anchor",
         default=None,
@@ -490,6 +595,7 @@ def main():
         save_cursors=args.save_cursors,
         visual=args.visual,
         nc_week_anchor=nc_anchor,
+        visual_separate=args.visual_separate,
     )
 
 
@@ -27,13 +27,25 @@ See docs/architecture.md, src/schedule_config.py
 import logging
 import math
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from itertools import chain, groupby
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 # Type alias
 Schedule = Dict[str, List[Tuple[str, str]]]   # date_str → [(shift, name)]
 
+# schedule_period keeps its cursor as an integer count of 1/CURSOR_SCALE
+# steps, so fractional weights (0.25, 0.81, ...) sum exactly instead of
+# drifting across an integer boundary. 1e-4 is also the precision
+# save_cursor_state persists.
+CURSOR_SCALE = 10_000
+
+# Weekday shifts a radiologist may hold at most one of per day; holding any
+# of them (IR-1/IR-2/IR-CALL included) excludes them from other blocks
+_EXCLUSIVE_WEEKDAY_SHIFTS = frozenset({"M0", "M1", "M2", "M3", "IR-1", "IR-2", "IR-CALL"})
+
 # ---------------------------------------------------------------------------
 # Week-parity helper
 # ---------------------------------------------------------------------------
@@ -54,61 +66,50 @@ def _get_week_type(d: date, nc_anchor: Optional[date]) -> Optional[str]:
     return "nc" if weeks_diff % 2 == 0 else "km"
 
 
-# ---------------------------------------------------------------------------
-# Core: single slot assignment
-# ---------------------------------------------------------------------------
-
-def _pick_next(
-    people: List[Dict[str, Any]],
-    cursor: float,
-    already_assigned_today: set,
-    unavailable: set,
-    previous_period: Optional[set] = None,
-    allow_fallback: bool = True,
-) -> Tuple[Optional[Dict[str, Any]], float]:
+def _week_type_map(dates: Iterable[date], nc_anchor: date) -> Dict[date, str]:
     """
-    Pick the next eligible person from the stream starting at cursor.
-
-    Returns (person_dict, cursor_advanced_to) or (None, cursor) if no one available.
-    Tries strict mode (avoids previous_period) then falls back if allow_fallback.
+    _get_week_type for many dates at once: the anchor Monday is resolved a
+    single time and each date costs one ordinal subtraction.
     """
-    N = len(people)
-    if N == 0:
-        return None, cursor
-
-    def _scan(avoid_prev: bool) -> Optional[Tuple[Dict, float]]:
-        start_pos = int(math.floor(cursor)) % N
-        for offset in range(N):
-            pos = (start_pos + offset) % N
-            person = people[pos]
-            name = person["name"]
-            if name in already_assigned_today:
-                continue
-            if name in unavailable:
-                continue
-            if avoid_prev and previous_period and name in previous_period:
-                continue
-            # Found eligible
-            new_cursor = cursor + offset  # cursor advances to this person
-            return person, new_cursor
-        return None
-
-    result = _scan(avoid_prev=bool(previous_period))
-    if result is None and allow_fallback and previous_period:
-        logger.debug("Back-to-back fallback triggered")
-        result = _scan(avoid_prev=False)
+    anchor_monday = nc_anchor.toordinal() - nc_anchor.weekday()
+    return {
+        d: "nc" if (d.toordinal() - d.weekday() - anchor_monday) // 7 % 2 == 0 else "km"
+        for d in dates
+    }
 
-    if result is None:
-        logger.warning(f"No eligible person found at cursor={cursor}, unavailable={unavailable}")
-        return None, cursor
 
-    return result[0], result[1]
+def _week_bucket(d: date) -> int:
+    """Monday-to-Sunday week number (ordinal 1 is a Monday) for slots_per_week caps."""
+    return (d.toordinal() - 1) // 7
 
 
 # ---------------------------------------------------------------------------
 # Core: schedule_period (single rotation pool, single block)
 # ---------------------------------------------------------------------------
 
+PreparedPool = Tuple[List[Dict[str, Any]], Dict[str, int]]
+
+
+def prepare_people(people: List[Dict[str, Any]]) -> PreparedPool:
+    """
+    Sort a pool into stream order and map each name to the bitmask of its
+    stream positions. Pass the result as schedule_period(prepared=...) to
+    reuse it across repeated runs over the same pool.
+    """
+    # Sort by roster index to ensure consistent rotation order regardless of
+    # how the pool was filtered. Cursor math uses array position (0..N-1).
+    ordered = sorted(people, key=lambda p: p["index"])
+    return ordered, _position_bits(ordered)
+
+
+def _position_bits(ordered: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Name → bitmask of its positions in an already index-sorted pool."""
+    name_bits: Dict[str, int] = {}
+    for i, p in enumerate(ordered):
+        name_bits[p["name"]] = name_bits.get(p["name"], 0) | (1 << i)
+    return name_bits
+
+
 def schedule_period(
     people: List[Dict[str, Any]],
     dates: List[date],
@@ -116,11 +117,12 @@ def schedule_period(
     shift_names: Optional[List[str]] = None,
     shift_weights: Optional[Dict[str, float]] = None,
     cursor: Union[int, float] = 0,
-    vacation_map: Optional[Dict[str, List[str]]] = None,
+    vacation_map: Optional[Dict[str, Iterable[str]]] = None,
     avoid_previous: bool = False,
     allow_fallback: bool = True,
     use_weighted_cursor: bool = True,
     fte_weight: bool = False,
+    prepared: Optional[PreparedPool] = None,
 ) -> Tuple[Schedule, float]:
     """
     Schedule shifts for a list of dates using the infinite modulo stream.
@@ -134,11 +136,12 @@ def schedule_period(
                              Defaults to ['S0','S1',...].
         shift_weights:       Weight per shift name (cursor advance). Default 1.0.
         cursor:              Starting float cursor position in stream.
-        vacation_map:        {date_str: [unavailable_names]}.
+        vacation_map:        {date_str: [unavailable_names]} (any iterable of names).
         avoid_previous:      If True, avoid last period's assigned names (back-to-back).
         allow_fallback:      If True, relax avoid_previous when pool too small.
         use_weighted_cursor: If True, advance cursor by shift weight; else by 1.0.
         fte_weight:          Reserved: FTE-proportional scheduling (future).
+        prepared:            prepare_people(people), if the caller already has it.
 
     Returns:
         (schedule, final_cursor)
@@ -153,85 +156,168 @@ def schedule_period(
     if N == 0:
         raise ValueError("people list is empty — check pool filter")
 
-    # Sort by roster index to ensure consistent rotation order regardless of
-    # how the pool was filtered. Cursor math uses array position (0..N-1).
-    people = sorted(people, key=lambda p: p["index"])
-
-    # Build shift name list
+    # Default shift names (shorter lists repeat via the slot loop's modulo)
     if shift_names is None:
         shift_names = [f"S{i}" for i in range(shifts_per_period)]
-    if len(shift_names) < shifts_per_period:
-        shift_names = (shift_names * math.ceil(shifts_per_period / len(shift_names)))[:shifts_per_period]
 
-    schedule: Schedule = {}
-    float_cursor = float(cursor)
-    previous_names: Optional[set] = None
+    # Stream order + name → bitmask of stream positions (bit i = people[i])
+    people, name_bits = prepared if prepared is not None else prepare_people(people)
 
+    # One pass up front: date key + unavailable mask per date (off-pool
+    # vacation names have no bits and drop out)
+    prepped: List[Tuple[str, int]] = []
     for day in dates:
         date_str = day.isoformat()
-        unavailable = set(vacation_map.get(date_str, []))
-        assigned_today: set = set()
+        unavailable = 0
+        for name in vacation_map.get(date_str, ()):
+            unavailable |= name_bits.get(name, 0)
+        prepped.append((date_str, unavailable))
+
+    # Per-slot (shift, cursor weight in CURSOR_SCALE units), resolved once
+    slots: List[Tuple[str, int]] = []
+    for slot_idx in range(shifts_per_period):
+        shift = shift_names[slot_idx % len(shift_names)]
+        weight = shift_weights.get(shift, 1.0) if use_weighted_cursor else 1.0
+        slots.append((shift, round(weight * CURSOR_SCALE)))
+
+    # Per-position columns, so a pick is resolved by list indexing alone
+    names = [p["name"] for p in people]
+    position_bits = [name_bits[name] for name in names]
+
+    # Availability is bitmask-coded by stream position (bit i = people[i]).
+    # A pick rotates the free mask so the cursor's position is bit 0 and
+    # takes the lowest set bit: the offset the cursor advances to reach the
+    # next eligible person. Inlined in the slot loop below — this is the
+    # scheduler's hot path.
+    full = (1 << N) - 1
+    schedule: Schedule = {}
+    scaled_cursor = round(float(cursor) * CURSOR_SCALE)
+    previous_mask = 0
+    # Per-slot debug line: level checked once, formatted only when enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for date_str, unavailable in prepped:
+        assigned_today = 0
+        avoid_mask = previous_mask if avoid_previous else 0
         day_assignments: List[Tuple[str, str]] = []
 
-        for slot_idx in range(shifts_per_period):
-            shift = shift_names[slot_idx % len(shift_names)]
-            weight = shift_weights.get(shift, 1.0) if use_weighted_cursor else 1.0
-
-            person, new_cursor = _pick_next(
-                people=people,
-                cursor=float_cursor,
-                already_assigned_today=assigned_today,
-                unavailable=unavailable,
-                previous_period=previous_names if avoid_previous else None,
-                allow_fallback=allow_fallback,
-            )
-
-            if person is None:
+        for shift, weight in slots:
+            position = scaled_cursor // CURSOR_SCALE
+            start = position % N
+            free = full & ~(assigned_today | unavailable)
+            # Strict mode avoids last period's assignees; fall back if allowed
+            eligible = free & ~avoid_mask
+            if not eligible and free and avoid_mask and allow_fallback:
+                if debug:
+                    logger.debug("Back-to-back fallback triggered")
+                eligible = free
+
+            if not eligible:
+                logger.warning(
+                    f"No eligible person found at cursor={scaled_cursor / CURSOR_SCALE}, "
+                    f"unavailable={set(vacation_map.get(date_str, ()))}"
+                )
                 logger.error(f"Could not fill {shift} on {date_str}")
                 day_assignments.append((shift, "UNFILLED"))
-                float_cursor += weight
+                scaled_cursor += weight
                 continue
 
+            rotated = (eligible >> start) | ((eligible << (N - start)) & full)
+            offset = (rotated & -rotated).bit_length() - 1
+
             # Advance cursor past this person + weight
-            advance = (new_cursor - float_cursor) + weight
-            float_cursor += advance
+            scaled_cursor += offset * CURSOR_SCALE + weight
 
-            assigned_today.add(person["name"])
-            day_assignments.append((shift, person["name"]))
-            logger.debug(f"{date_str} {shift} → {person['name']} (cursor={float_cursor:.2f})")
+            pos = (position + offset) % N
+            assigned_today |= position_bits[pos]
+            day_assignments.append((shift, names[pos]))
+            if debug:
+                logger.debug(
+                    "%s %s → %s (cursor=%.2f)",
+                    date_str, shift, names[pos], scaled_cursor / CURSOR_SCALE,
+                )
 
         schedule[date_str] = day_assignments
-        previous_names = assigned_today  # for next period back-to-back check
+        previous_mask = assigned_today  # for next period back-to-back check
 
-    return schedule, float_cursor
+    return schedule, scaled_cursor / CURSOR_SCALE
 
 
 # ---------------------------------------------------------------------------
 # Convenience wrappers (weekday / weekend / IR)
 # ---------------------------------------------------------------------------
 
-def schedule_weekday_mercy(
+# Fixed schedule_period settings per wrapper; schedule_profile() dispatches.
+# min_pool: smallest pool the profile can fill (ValueError below it, naming pool_label).
+SHIFT_PROFILES: Dict[str, Dict[str, Any]] = {
+    "weekday_mercy": {
+        "shift_names": ["M0", "M1", "M2", "M3"],
+        "shift_weights": {"M0": 0.25, "M1": 1.00, "M2": 1.00, "M3": 0.75},
+        "avoid_previous": False,
+    },
+    "weekend_mercy": {
+        "shift_names": ["M0_WEEKEND", "EP", "Dx-CALL"],
+        "shift_weights": {"M0_WEEKEND": 0.25, "EP": 0.81, "Dx-CALL": 1.00},
+        "avoid_previous": True,
+    },
+    "ir_weekday": {
+        "shift_names": ["IR-1", "IR-2"],
+        "shift_weights": {"IR-1": 1.00, "IR-2": 1.00},
+        "avoid_previous": False,
+        "min_pool": 2,
+        "pool_label": "IR",
+    },
+}
+
+
+def schedule_profile(
+    profile: str,
     people: List[Dict[str, Any]],
     dates: List[date],
     cursor: float = 0.0,
-    vacation_map: Optional[Dict[str, List[str]]] = None,
+    vacation_map: Optional[Dict[str, Iterable[str]]] = None,
     shift_names: Optional[List[str]] = None,
     shift_weights: Optional[Dict[str, float]] = None,
+    prepared: Optional[PreparedPool] = None,
 ) -> Tuple[Schedule, float]:
-    """Mercy weekday M0/M1/M2/M3 with weighted cursor."""
-    _shift_names = shift_names or ["M0", "M1", "M2", "M3"]
-    _weights = shift_weights or {"M0": 0.25, "M1": 1.00, "M2": 1.00, "M3": 0.75}
+    """
+    Run schedule_period with a SHIFT_PROFILES entry (weighted cursor, fallback on).
+    shift_names / shift_weights override the profile's when given.
+    """
+    spec = SHIFT_PROFILES[profile]
+    min_pool = spec.get("min_pool", 0)
+    if len(people) < min_pool:
+        raise ValueError(
+            f"{spec.get('pool_label', profile)} pool has only {len(people)} person(s); need ≥{min_pool} "
+            f"for {'/'.join(spec['shift_names'])}."
+        )
+    _shift_names = shift_names or spec["shift_names"]
     return schedule_period(
         people=people,
         dates=dates,
         shifts_per_period=len(_shift_names),
         shift_names=_shift_names,
-        shift_weights=_weights,
+        shift_weights=shift_weights or spec["shift_weights"],
         cursor=cursor,
         vacation_map=vacation_map,
-        avoid_previous=False,
+        avoid_previous=spec["avoid_previous"],
         allow_fallback=True,
         use_weighted_cursor=True,
+        prepared=prepared,
+    )
+
+
+def schedule_weekday_mercy(
+    people: List[Dict[str, Any]],
+    dates: List[date],
+    cursor: float = 0.0,
+    vacation_map: Optional[Dict[str, Iterable[str]]] = None,
+    shift_names: Optional[List[str]] = None,
+    shift_weights: Optional[Dict[str, float]] = None,
+) -> Tuple[Schedule, float]:
+    """Mercy weekday M0/M1/M2/M3 with weighted cursor."""
+    return schedule_profile(
+        "weekday_mercy", people, dates, cursor, vacation_map, shift_names, shift_weights,
     )
 
 
@@ -239,44 +325,20 @@ def schedule_weekend_mercy(
     people: List[Dict[str, Any]],
     dates: List[date],
     cursor: float = 0.0,
-    vacation_map: Optional[Dict[str, List[str]]] = None,
+    vacation_map: Optional[Dict[str, Iterable[str]]] = None,
 ) -> Tuple[Schedule, float]:
     """Weekend M0_WEEKEND/EP/Dx-CALL with back-to-back avoidance."""
-    return schedule_period(
-        people=people,
-        dates=dates,
-        shifts_per_period=3,
-        shift_names=["M0_WEEKEND", "EP", "Dx-CALL"],
-        shift_weights={"M0_WEEKEND": 0.25, "EP": 0.81, "Dx-CALL": 1.00},
-        cursor=cursor,
-        vacation_map=vacation_map,
-        avoid_previous=True,
-        allow_fallback=True,
-        use_weighted_cursor=True,
-    )
+    return schedule_profile("weekend_mercy", people, dates, cursor, vacation_map)
 
 
 def schedule_ir_weekday(
     people: List[Dict[str, Any]],
     dates: List[date],
     cursor: float = 0.0,
-    vacation_map: Optional[Dict[str, List[str]]] = None,
+    vacation_map: Optional[Dict[str, Iterable[str]]] = None,
 ) -> Tuple[Schedule, float]:
     """IR weekday IR-1/IR-2. Pool must be IR-qualified (4 radiologists)."""
-    if len(people) < 2:
-        raise ValueError(f"IR pool has only {len(people)} person(s); need ≥2 for IR-1/IR-2.")
-    return schedule_period(
-        people=people,
-        dates=dates,
-        shifts_per_period=2,
-        shift_names=["IR-1", "IR-2"],
-        shift_weights={"IR-1": 1.00, "IR-2": 1.00},
-        cursor=cursor,
-        vacation_map=vacation_map,
-        avoid_previous=False,
-        allow_fallback=True,
-        use_weighted_cursor=True,
-    )
+    return schedule_profile("ir_weekday", people, dates, cursor, vacation_map)
 
 
 # ---------------------------------------------------------------------------
@@ -301,7 +363,7 @@ def schedule_blocks(
         dates:           Weekday dates to schedule (weekend_dates separate).
         cursor_state:    Dict of {cursor_key: float} — mutated in place & returned.
         vacation_map:    {date_str: [unavailable_names]}.
-        blocks:          Block dicts (schedule_config.SCHEDULING_BLOCKS).
+        blocks:          Block dicts (default: schedule_config.SCHEDULING_BLOCKS).
         interactive:     If True, prompt user before each block.
         weekend_dates:   Sat+Sun dates for weekend blocks.
         nc_week_anchor:  A Monday (or any date) known to be an NC week. Used to
@@ -312,16 +374,32 @@ def schedule_blocks(
     Returns:
         (merged_schedule, updated_cursor_state)
     """
-    from src.schedule_config import SCHEDULING_BLOCKS
-
-    if blocks is None:
-        blocks = SCHEDULING_BLOCKS
+    from src.schedule_config import OUTPATIENT_SHIFTS, SCHEDULING_BLOCKS_SORTED
 
-    if vacation_map is None:
-        vacation_map = {}
+    # Frozen once here: every block unions these with its blocked names
+    vacation_map = {d: frozenset(names) for d, names in (vacation_map or {}).items()}
 
     merged: Schedule = {}
-    blocks_sorted = sorted(blocks, key=lambda b: b["priority"])
+    merged_shifts: Dict[str, set] = {}   # date → shifts already in merged
+    if blocks is None:
+        blocks_sorted = SCHEDULING_BLOCKS_SORTED
+    else:
+        blocks_sorted = sorted(blocks, key=lambda b: b["priority"])
+    # Names already placed per date, grouped as the later blocks' exclusions
+    # need them; filled in as each block merges (see augmented_vacation)
+    prior_names: Dict[str, set] = {}
+    exclusive_names: Dict[str, set] = {}
+    outpatient_names: Dict[str, set] = {}
+    # Stream order once: _filter_pool keeps roster order, so every block's
+    # pool comes out index-sorted and schedule_period needn't re-sort it
+    # (load_roster already sorts, so usually no copy is needed)
+    if any(a["index"] > b["index"] for a, b in zip(roster, roster[1:])):
+        roster = sorted(roster, key=lambda p: p["index"])
+
+    # NC/KM parity for every candidate date, shared by all blocks' filters
+    week_type_of: Dict[date, str] = {}
+    if nc_week_anchor:
+        week_type_of = _week_type_map(chain(dates, weekend_dates or ()), nc_week_anchor)
 
     for block in blocks_sorted:
         config = block["config"]
@@ -349,21 +427,20 @@ def schedule_blocks(
                 continue
 
         # ── Determine date list for this block ──────────────────────────────
+        # The caller's list is only read; each filter below builds a new
+        # list, so blocks without filters use it as is (no per-block copy).
         if schedule_type == "weekend":
             if not weekend_dates:
                 logger.debug(f"Block '{label}': no weekend_dates — skipping")
                 continue
-            block_dates = list(weekend_dates)
+            block_dates = weekend_dates
         else:
-            block_dates = list(dates)
+            block_dates = dates
 
         # 1. week_type filter: only include dates in NC or KM weeks
         week_type = config.get("week_type")
         if week_type and nc_week_anchor and block_dates:
-            block_dates = [
-                d for d in block_dates
-                if _get_week_type(d, nc_week_anchor) == week_type
-            ]
+            block_dates = [d for d in block_dates if week_type_of[d] == week_type]
             logger.debug(
                 f"Block '{label}': week_type='{week_type}' → {len(block_dates)} dates"
             )
@@ -375,7 +452,7 @@ def schedule_blocks(
         if (allowed_nc is not None or allowed_km is not None) and nc_week_anchor:
             filtered = []
             for d in block_dates:
-                wt = _get_week_type(d, nc_week_anchor)
+                wt = week_type_of[d]
                 if wt == "nc" and allowed_nc is not None:
                     if d.weekday() in allowed_nc:
                         filtered.append(d)
@@ -400,12 +477,9 @@ def schedule_blocks(
         # 3. slots_per_week cap (demand-based; only for weekday blocks)
         slots_per_week = config.get("slots_per_week")
         if slots_per_week is not None and block_dates and schedule_type == "weekday":
-            from itertools import groupby
-            def week_key(d):
-                return d.isocalendar()[0], d.isocalendar()[1]
             block_dates_sorted = sorted(block_dates)
             limited = []
-            for (_y, _w), week_dates in groupby(block_dates_sorted, key=week_key):
+            for _week, week_dates in groupby(block_dates_sorted, key=_week_bucket):
                 week_list = list(week_dates)
                 limited.extend(week_list[: int(slots_per_week)])
             block_dates = limited
@@ -422,62 +496,23 @@ def schedule_blocks(
 
         concurrent_ok = block.get("concurrent_ok", False)
 
-        # Build augmented vacation map: existing vacation PLUS names already
+        # Augmented vacation map: existing vacation PLUS names already
         # assigned in earlier blocks on each date (prevents double-booking).
-        # Hard: No IR weekday + Gen same day; no radiologist with 2 distinct weekday tasks.
-        _IR_WEEKDAY_SHIFTS = {"IR-1", "IR-2", "IR-CALL"}
-        _EXCLUSIVE_WEEKDAY_SHIFTS = {"M0", "M1", "M2", "M3", "IR-1", "IR-2", "IR-CALL"}
-        augmented_vacation = {}
-        for d in (vacation_map or {}):
-            augmented_vacation[d] = list(vacation_map.get(d, []))
-        if not concurrent_ok:
-            for date_str, prior_assignments in merged.items():
-                prior_names = [name for _, name in prior_assignments if name != "UNFILLED"]
-                if prior_names:
-                    if date_str not in augmented_vacation:
-                        augmented_vacation[date_str] = []
-                    augmented_vacation[date_str] = list(set(
-                        augmented_vacation.get(date_str, []) + prior_names
-                    ))
-        # Always exclude IR-1/IR-2 assignees from all other blocks on that date
-        for date_str, prior_assignments in merged.items():
-            ir_weekday_names = [
-                name for shift, name in prior_assignments
-                if name != "UNFILLED" and shift in _IR_WEEKDAY_SHIFTS
-            ]
-            if ir_weekday_names:
-                if date_str not in augmented_vacation:
-                    augmented_vacation[date_str] = []
-                augmented_vacation[date_str] = list(set(
-                    augmented_vacation.get(date_str, []) + ir_weekday_names
-                ))
-        # No radiologist may cover 2 distinct weekday tasks: exclude anyone with
-        # any exclusive weekday shift (M0,M1,M2,M3,IR-1,IR-2) from other blocks that day.
-        for date_str, prior_assignments in merged.items():
-            exclusive_names = [
-                name for shift, name in prior_assignments
-                if name != "UNFILLED" and shift in _EXCLUSIVE_WEEKDAY_SHIFTS
-            ]
-            if exclusive_names:
-                if date_str not in augmented_vacation:
-                    augmented_vacation[date_str] = []
-                augmented_vacation[date_str] = list(set(
-                    augmented_vacation.get(date_str, []) + exclusive_names
-                ))
-        # Outpatient blocks: at most one outpatient assignment per person per day
+        # Hard: No IR weekday + Gen same day; no radiologist with 2 distinct
+        # weekday tasks — anyone holding an exclusive weekday shift
+        # (M0-M3, IR-1, IR-2, IR-CALL) is out of every other block that day.
+        # Outpatient blocks: at most one outpatient assignment per person per day.
         if concurrent_ok:
-            from src.schedule_config import OUTPATIENT_SHIFTS
-            for date_str, prior_assignments in merged.items():
-                prior_outpatient_names = [
-                    name for shift, name in prior_assignments
-                    if name != "UNFILLED" and shift in OUTPATIENT_SHIFTS
-                ]
-                if prior_outpatient_names:
-                    if date_str not in augmented_vacation:
-                        augmented_vacation[date_str] = []
-                    augmented_vacation[date_str] = list(set(
-                        augmented_vacation.get(date_str, []) + prior_outpatient_names
-                    ))
+            blocked = {
+                d: exclusive_names.get(d, set()) | outpatient_names.get(d, set())
+                for d in exclusive_names.keys() | outpatient_names.keys()
+            }
+        else:
+            blocked = prior_names
+        augmented_vacation: Dict[str, Iterable[str]] = dict(vacation_map)
+        for date_str, names in blocked.items():
+            if names:
+                augmented_vacation[date_str] = names | vacation_map.get(date_str, frozenset())
 
         block_schedule, new_cursor = schedule_period(
             people=pool,
@@ -490,6 +525,7 @@ def schedule_blocks(
             avoid_previous=config.get("avoid_previous", False),
             allow_fallback=config.get("allow_fallback", True),
             use_weighted_cursor=config.get("use_weighted_cursor", True),
+            prepared=(pool, _position_bits(pool)),
         )
 
         cursor_state[cursor_key] = new_cursor
@@ -498,19 +534,22 @@ def schedule_blocks(
         # Used for IR-CALL where the same IR person covers Fri+Sat+Sun.
         if config.get("mirror_weekend"):
             mirrored: Schedule = {}
-            for date_str, assignments in block_schedule.items():
-                d = date.fromisoformat(date_str)
-                if d.weekday() == 4:   # Friday
-                    sat = d + timedelta(days=1)
-                    sun = d + timedelta(days=2)
-                    for mirror_day in (sat, sun):
-                        mirror_str = mirror_day.isoformat()
-                        if mirror_str not in mirrored:
-                            mirrored[mirror_str] = []
-                        for shift_name, person_name in assignments:
-                            if person_name == "UNFILLED":
-                                continue
-                            mirrored[mirror_str].append((shift_name, person_name))
+            # block_dates are the scheduled dates already parsed (deduped in
+            # block_schedule's key order) — no isoformat round trip needed
+            for d in dict.fromkeys(block_dates):
+                if d.weekday() != 4:   # Friday
+                    continue
+                assignments = block_schedule[d.isoformat()]
+                sat = d + timedelta(days=1)
+                sun = d + timedelta(days=2)
+                for mirror_day in (sat, sun):
+                    mirror_str = mirror_day.isoformat()
+                    if mirror_str not in mirrored:
+                        mirrored[mirror_str] = []
+                    for shift_name, person_name in assignments:
+                        if person_name == "UNFILLED":
+                            continue
+                        mirrored[mirror_str].append((shift_name, person_name))
             # Merge mirrored entries — Sat/Sun IR-CALL
             for date_str, assignments in mirrored.items():
                 if date_str not in block_schedule:
@@ -526,7 +565,8 @@ def schedule_blocks(
         for date_str, assignments in block_schedule.items():
             if date_str not in merged:
                 merged[date_str] = []
-            existing_shifts = {shift for shift, _ in merged[date_str]}
+                merged_shifts[date_str] = set()
+            existing_shifts = merged_shifts[date_str]
             for shift_name, person_name in assignments:
                 if shift_name in existing_shifts:
                     logger.warning(
@@ -535,8 +575,20 @@ def schedule_blocks(
                     continue
                 merged[date_str].append((shift_name, person_name))
                 existing_shifts.add(shift_name)
-
-        logger.info(f"Block '{label}' scheduled: {sum(len(v) for v in block_schedule.values())} assignments, cursor→{new_cursor:.2f}")
+                # Keep the per-date blocked-name sets current for later blocks
+                if person_name == "UNFILLED":
+                    continue
+                prior_names.setdefault(date_str, set()).add(person_name)
+                if shift_name in _EXCLUSIVE_WEEKDAY_SHIFTS:
+                    exclusive_names.setdefault(date_str, set()).add(person_name)
+                if shift_name in OUTPATIENT_SHIFTS:
+                    outpatient_names.setdefault(date_str, set()).add(person_name)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Block '%s' scheduled: %d assignments, cursor→%.2f",
+                label, sum(map(len, block_schedule.values())), new_cursor,
+            )
 
     return merged, cursor_state
 
@@ -545,6 +597,12 @@ def schedule_blocks(
 # Fairness Metrics
 # ---------------------------------------------------------------------------
 
+# _summarize_fairness reduces with Python sum() passes below this many people
+# and with NumPy arrays from here up. At roster size (~20) the array set-up
+# costs more than it saves, and the sum() passes keep the reported std/CV
+# bit-for-bit stable (NumPy's pairwise summation moves the last ulp).
+VECTOR_FAIRNESS_MIN_PEOPLE = 64
+
 def calculate_fairness_metrics(
     schedule: Schedule,
     people: List[Dict[str, Any]],
@@ -562,63 +620,229 @@ def calculate_fairness_metrics(
           unfilled: int,
         }
     """
+    shift_weights, shift_hours = _resolve_shift_costs(shift_weights)
+    counts = _count_assignments(schedule, people, shift_weights, shift_hours, {})
+    return _summarize_fairness(*counts)
+
+
+def calculate_fairness_metrics_batch(
+    schedules: List[Schedule],
+    people: List[Dict[str, Any]],
+    shift_weights: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    calculate_fairness_metrics for many schedules over the same roster
+    (backtesting / Monte Carlo runs).
+
+    Shift weights and hours are resolved once for the whole batch, and the
+    weighted / hours mean and std come from one (n_schedules × n_people)
+    matrix each, reduced row-wise. Returns one result dict per schedule,
+    in order.
+    """
+    import numpy as np
+
+    shift_weights, shift_hours = _resolve_shift_costs(shift_weights)
+    shift_cost: Dict[str, Tuple[float, float]] = {}
+    counted = [
+        _count_assignments(schedule, people, shift_weights, shift_hours, shift_cost)
+        for schedule in schedules
+    ]
+    if not counted:
+        return []
+
+    def _row_moments(rows: List[List[float]]) -> Tuple[List[float], List[float]]:
+        grid = np.array(rows, dtype=np.float64)
+        if not grid.shape[1]:
+            return [0.0] * len(rows), [0.0] * len(rows)
+        return grid.mean(axis=1).tolist(), grid.std(axis=1).tolist()
+
+    means, stds = _row_moments([list(c[1].values()) for c in counted])
+    hours_means, hours_stds = _row_moments([list(c[2].values()) for c in counted])
+    return [
+        _summarize_fairness(*c, moments=(means[i], stds[i], hours_means[i], hours_stds[i]))
+        for i, c in enumerate(counted)
+    ]
+
+
+def _resolve_shift_costs(
+    shift_weights: Optional[Dict[str, float]],
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """(shift_weights or SHIFT_DEFINITIONS weights, SHIFT_DEFINITIONS hours)."""
     from src.schedule_config import SHIFT_DEFINITIONS
 
     if shift_weights is None:
         shift_weights = {k: v["weight"] for k, v in SHIFT_DEFINITIONS.items()}
     shift_hours = {k: v.get("hours", 8) for k, v in SHIFT_DEFINITIONS.items()}
+    return shift_weights, shift_hours
+
 
-    raw_counts: Dict[str, int] = {p["name"]: 0 for p in people}
-    weighted_counts: Dict[str, float] = {p["name"]: 0.0 for p in people}
-    hours_counts: Dict[str, float] = {p["name"]: 0.0 for p in people}
-    per_shift: Dict[str, Dict[str, int]] = {}
+def _count_assignments(
+    schedule: Schedule,
+    people: List[Dict[str, Any]],
+    shift_weights: Dict[str, float],
+    shift_hours: Dict[str, float],
+    shift_cost: Dict[str, Tuple[float, float]],
+) -> Tuple[Dict[str, int], Dict[str, float], Dict[str, float], Dict[str, Dict[str, int]], int]:
+    """
+    One pass over schedule → (raw_counts, weighted_counts, hours_counts,
+    per_shift, unfilled). shift_cost caches shift_name → (weight, hours)
+    and may be shared across calls with the same weights.
+
+    The pass only maps each filled assignment to (person, shift) indices;
+    the tallies are np.bincount reductions over those, in schedule order.
+    """
+    import numpy as np
+
+    names = list(dict.fromkeys(p["name"] for p in people))
+    position = {name: i for i, name in enumerate(names)}
+    shift_index: Dict[str, int] = {}
+    person_idx: List[int] = []
+    shift_idx: List[int] = []
     unfilled = 0
 
-    for _date, assignments in schedule.items():
+    for assignments in schedule.values():
         for shift_name, person_name in assignments:
             if person_name == "UNFILLED":
                 unfilled += 1
                 continue
-            if person_name not in raw_counts:
+            i = position.get(person_name)
+            if i is None:
                 # Radiologist not in current roster (e.g. locum) — skip
                 continue
+            s = shift_index.get(shift_name)
+            if s is None:
+                s = shift_index[shift_name] = len(shift_index)
+            person_idx.append(i)
+            shift_idx.append(s)
+
+    costs = []
+    for shift_name in shift_index:
+        cost = shift_cost.get(shift_name)
+        if cost is None:
+            cost = shift_cost[shift_name] = (
+                shift_weights.get(shift_name, 1.0), shift_hours.get(shift_name, 8),
+            )
+        costs.append(cost)
+    N, S = len(names), len(shift_index)
+    persons = np.array(person_idx, dtype=np.intp)
+    shifts = np.array(shift_idx, dtype=np.intp)
+    cost_grid = np.array(costs, dtype=np.float64).reshape(S, 2)
+
+    raw = np.bincount(persons, minlength=N)
+    weighted = np.bincount(persons, weights=cost_grid[shifts, 0], minlength=N)
+    hours = np.bincount(persons, weights=cost_grid[shifts, 1], minlength=N)
+    grid = np.bincount(shifts * N + persons, minlength=S * N).reshape(S, N)
+
+    raw_counts: Dict[str, int] = dict(zip(names, raw.tolist()))
+    weighted_counts: Dict[str, float] = dict(zip(names, weighted.tolist()))
+    hours_counts: Dict[str, float] = dict(zip(names, hours.tolist()))
+    per_shift: Dict[str, Dict[str, int]] = {
+        shift_name: dict(zip(names, row)) for shift_name, row in zip(shift_index, grid.tolist())
+    }
+    return raw_counts, weighted_counts, hours_counts, per_shift, unfilled
 
-            raw_counts[person_name] += 1
-            w = shift_weights.get(shift_name, 1.0)
-            weighted_counts[person_name] += w
-            hrs = shift_hours.get(shift_name, 8)
-            hours_counts[person_name] += hrs
-
-            if shift_name not in per_shift:
-                per_shift[shift_name] = {p["name"]: 0 for p in people}
-            if person_name in per_shift[shift_name]:
-                per_shift[shift_name][person_name] += 1
-
-    values = list(weighted_counts.values())
-    mean_val = sum(values) / len(values) if values else 0.0
-    variance = sum((v - mean_val) ** 2 for v in values) / len(values) if values else 0.0
-    std_val = math.sqrt(variance)
-    cv = (std_val / mean_val * 100) if mean_val > 0 else 0.0
 
-    hours_values = list(hours_counts.values())
-    hours_mean = sum(hours_values) / len(hours_values) if hours_values else 0.0
-    hours_variance = sum((v - hours_mean) ** 2 for v in hours_values) / len(hours_values) if hours_values else 0.0
-    hours_std = math.sqrt(hours_variance)
+def update_fairness_metrics(
+    metrics: Dict[str, Any],
+    people: List[Dict[str, Any]],
+    filled: List[Tuple[str, str]],
+    shift_weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Fairness metrics after UNFILLED slots were filled with (shift_name, person_name)
+    assignments — e.g. the repair loop's results — without rescanning the schedule.
+
+    Applies the deltas to copies of metrics' count dicts and re-derives the
+    summary stats (O(roster × shifts)). Equivalent to calculate_fairness_metrics
+    on the updated schedule up to float summation order.
+    """
+    shift_weights, shift_hours = _resolve_shift_costs(shift_weights)
+
+    raw_counts = dict(metrics["counts"])
+    weighted_counts = dict(metrics["weighted_counts"])
+    hours_counts = dict(metrics["hours_counts"])
+    per_shift = {shift: dict(counts) for shift, counts in metrics["per_shift"].items()}
+    unfilled = metrics["unfilled"]
+
+    for shift_name, person_name in filled:
+        unfilled -= 1
+        if person_name not in raw_counts:
+            continue
+        raw_counts[person_name] += 1
+        weighted_counts[person_name] += shift_weights.get(shift_name, 1.0)
+        hours_counts[person_name] += shift_hours.get(shift_name, 8)
+        if shift_name not in per_shift:
+            per_shift[shift_name] = dict.fromkeys((p["name"] for p in people), 0)
+        if person_name in per_shift[shift_name]:
+            per_shift[shift_name][person_name] += 1
+
+    return _summarize_fairness(raw_counts, weighted_counts, hours_counts, per_shift, unfilled)
+
+
+def _summarize_fairness(
+    raw_counts: Dict[str, int],
+    weighted_counts: Dict[str, float],
+    hours_counts: Dict[str, float],
+    per_shift: Dict[str, Dict[str, int]],
+    unfilled: int,
+    moments: Optional[Tuple[float, float, float, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Derive mean/std/CV summaries from per-person counts (calculate_fairness_metrics'
+    result dict). Rosters of VECTOR_FAIRNESS_MIN_PEOPLE or more reduce as NumPy
+    array ops, with per-shift CVs from one shifts × people matrix when every
+    shift row covers the same people; smaller ones use Python sum() passes.
+    moments = (mean, std, hours_mean, hours_std) when already computed
+    (calculate_fairness_metrics_batch).
+    """
+    if len(weighted_counts) < VECTOR_FAIRNESS_MIN_PEOPLE:
+        def _mean_std(values: Iterable[float]) -> Tuple[float, float]:
+            values = list(values)
+            if not values:
+                return 0.0, 0.0
+            mean = sum(values) / len(values)
+            return mean, math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+    else:
+        import numpy as np
+
+        def _mean_std(values: Iterable[float]) -> Tuple[float, float]:
+            arr = np.fromiter(values, dtype=np.float64)
+            if not arr.size:
+                return 0.0, 0.0
+            return float(arr.mean()), float(arr.std())
+
+    if moments is None:
+        mean_val, std_val = _mean_std(weighted_counts.values())
+        hours_mean, hours_std = _mean_std(hours_counts.values())
+    else:
+        mean_val, std_val, hours_mean, hours_std = moments
+    cv = (std_val / mean_val * 100) if mean_val > 0 else 0.0
     hours_cv = (hours_std / hours_mean * 100) if hours_mean > 0 else 0.0
 
     per_shift_cv: Dict[str, float] = {}
-    for shift, counts in per_shift.items():
-        sv = list(counts.values())
-        sm = sum(sv) / len(sv) if sv else 0
-        sv_std = math.sqrt(sum((v - sm) ** 2 for v in sv) / len(sv)) if sv else 0
-        per_shift_cv[shift] = (sv_std / sm * 100) if sm > 0 else 0.0
+    if (
+        len(weighted_counts) >= VECTOR_FAIRNESS_MIN_PEOPLE
+        and len({len(counts) for counts in per_shift.values()}) == 1
+    ):
+        grid = np.array([list(counts.values()) for counts in per_shift.values()], dtype=np.float64)
+        if grid.shape[1]:
+            means = grid.mean(axis=1)
+            stds = grid.std(axis=1)
+            cvs = np.divide(stds * 100, means, out=np.zeros_like(means), where=means > 0)
+        else:
+            cvs = np.zeros(len(per_shift))
+        per_shift_cv = dict(zip(per_shift, cvs.tolist()))
+    else:
+        for shift, counts in per_shift.items():
+            sm, sv_std = _mean_std(counts.values())
+            per_shift_cv[shift] = (sv_std / sm * 100) if sm > 0 else 0.0
 
     return {
         "mean": mean_val,
         "std": std_val,
         "cv": cv,
-        "min": min(values) if values else 0,
-        "max": max(values) if values else 0,
+        "min": min(weighted_counts.values()) if weighted_counts else 0,
+        "max": max(weighted_counts.values()) if weighted_counts else 0,
         "counts": raw_counts,
         "weighted_counts": weighted_counts,
         "hours_counts": hours_counts,
@@ -715,24 +939,18 @@ def _interactive_confirm(prompt: str, can_skip: bool = True) -> bool:
 
 def get_weekday_dates(start: date, end: date) -> List[date]:
     """Return all Monday-Friday dates in [start, end]."""
-    out = []
-    d = start
-    while d <= end:
-        if d.weekday() < 5:
-            out.append(d)
-        d += timedelta(days=1)
-    return out
+    # Ordinal 1 is a Monday, so (ordinal - 1) % 7 is the weekday
+    return [
+        date.fromordinal(o)
+        for o in range(start.toordinal(), end.toordinal() + 1)
+        if (o - 1) % 7 < 5
+    ]
 
 
 def get_saturday_dates(start: date, end: date) -> List[date]:
     """Return all Saturdays in [start, end]."""
-    out = []
-    d = start
-    while d <= end:
-        if d.weekday() == 5:
-            out.append(d)
-        d += timedelta(days=1)
-    return out
+    first = start.toordinal() + (5 - start.weekday()) % 7
+    return [date.fromordinal(o) for o in range(first, end.toordinal() + 1, 7)]
 
 
 def get_weekend_dates(start: date, end: date) -> List[date]:
@@ -745,13 +963,38 @@ def get_weekend_dates(start: date, end: date) -> List[date]:
     to DIFFERENT radiologists from the same eligible pool.  Shift types
     are identical (EP, M0_WEEKEND, Dx-CALL, etc.); only personnel differ.
     """
-    out = []
-    d = start
-    while d <= end:
-        if d.weekday() in (5, 6):   # Saturday=5, Sunday=6
-            out.append(d)
-        d += timedelta(days=1)
-    return out
+    return [
+        date.fromordinal(o)
+        for o in range(start.toordinal(), end.toordinal() + 1)
+        if (o - 1) % 7 >= 5   # Saturday=5, Sunday=6
+    ]
+
+
+def get_date_lists(start: date, end: date) -> Tuple[List[date], List[date], List[date]]:
+    """
+    (weekdays, saturdays, weekends) for [start, end] in one pass — the same
+    lists as get_weekday_dates / get_saturday_dates / get_weekend_dates.
+    Weekday comes from the ordinal (ordinal 1 is a Monday).
+    """
+    weekdays: List[date] = []
+    saturdays: List[date] = []
+    weekends: List[date] = []
+    for ordinal in range(start.toordinal(), end.toordinal() + 1):
+        wd = (ordinal - 1) % 7
+        d = date.fromordinal(ordinal)
+        if wd < 5:
+            weekdays.append(d)
+        else:
+            weekends.append(d)
+            if wd == 5:
+                saturdays.append(d)
+    return weekdays, saturdays, weekends
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str: str) -> date:
+    """date.fromisoformat, memoized: the same date keys are parsed on every call."""
+    return date.fromisoformat(date_str)
 
 
 def expand_weekend_to_sunday(schedule: "Schedule") -> "Schedule":
@@ -769,11 +1012,8 @@ def expand_weekend_to_sunday(schedule: "Schedule") -> "Schedule":
         DeprecationWarning, stacklevel=2,
     )
     expanded = dict(schedule)
-    for date_str, assignments in list(schedule.items()):
-        d = date.fromisoformat(date_str)
+    for date_str, assignments in schedule.items():
+        d = _parse_iso(date_str)
         if d.weekday() == 5:
-            sunday = d + timedelta(days=1)
-            sun_str = sunday.isoformat()
-            if sun_str not in expanded:
-                expanded[sun_str] = list(assignments)
+            expanded.setdefault((d + timedelta(days=1)).isoformat(), list(assignments))
     return expanded
@@ -12,6 +12,7 @@ Usage:
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -40,19 +41,18 @@ def export_to_csv(
     import csv
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", newline="") as f:
-        if include_shift:
-            writer = csv.DictWriter(f, fieldnames=["date", "shift", "staff"])
-            writer.writeheader()
-            for date_str, assignments in sorted(schedule.items()):
-                for shift_name, person_name in assignments:
-                    writer.writerow({"date": date_str, "shift": shift_name, "staff": person_name})
-        else:
-            writer = csv.DictWriter(f, fieldnames=["date", "staff"])
-            writer.writeheader()
-            for date_str, assignments in sorted(schedule.items()):
-                for _, person_name in assignments:
-                    writer.writerow({"date": date_str, "staff": person_name})
+    days = sorted(schedule.items())
+    if include_shift:
+        header = ("date", "shift", "staff")
+        rows = ((d, s, n) for d, assignments in days for s, n in assignments)
+    else:
+        header = ("date", "staff")
+        rows = ((d, n) for d, assignments in days for _, n in assignments)
+
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
 
     logger.info(f"CSV exported → {output_path}")
 
@@ -67,6 +67,8 @@ def export_to_excel(
     pivot: bool = True,
     shift_order: Optional[List[str]] = None,
     name_to_initials: Optional[Dict[str, str]] = None,
+    engine: str = "openpyxl",
+    writer_options: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Export schedule to formatted Excel grid.
@@ -80,9 +82,10 @@ def export_to_excel(
         pivot:        If True, create date × shift grid
         shift_order:  Column order for pivot (defaults to appearance order)
         name_to_initials:  If provided, cells show initials (e.g. DA, JCV) instead of full names
+        engine:       "openpyxl" (default) or "xlsxwriter" (faster: no per-cell
+                      style objects); falls back to openpyxl if xlsxwriter is missing
+        writer_options:  Passed to the writer engine (e.g. xlsxwriter Workbook options)
     """
-    import pandas as pd
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
     name_map = name_to_initials or {}
 
@@ -90,9 +93,18 @@ def export_to_excel(
     for date_str, assignments in sorted(schedule.items()):
         for shift_name, person_name in assignments:
             display_name = name_map.get(person_name, person_name)
-            rows.append({"Date": date_str, "Shift": shift_name, "Staff": display_name})
+            rows.append((date_str, shift_name, display_name))
+
+    if rows and pivot:
+        engine = _excel_engine(engine)
+        if engine == "openpyxl":
+            _write_grid_openpyxl(output_path, rows, shift_order)
+            logger.info(f"Excel exported → {output_path}")
+            return
+
+    import pandas as pd
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(rows, columns=["Date", "Shift", "Staff"]) if rows else pd.DataFrame()
     if df.empty:
         df.to_excel(output_path, index=False)
         return
@@ -111,39 +123,139 @@ def export_to_excel(
             rest = [s for s in grid.columns if s not in shift_order]
             grid = grid[available + rest]
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+        engine_kwargs = {"options": writer_options} if writer_options else {}
+        with pd.ExcelWriter(output_path, engine=engine, engine_kwargs=engine_kwargs) as writer:
             grid.to_excel(writer, sheet_name="Schedule")
-            _format_excel_grid(writer, "Schedule", grid)
+            _format_excel_grid_xlsxwriter(writer, "Schedule", grid)
     else:
         df.to_excel(output_path, index=False)
 
     logger.info(f"Excel exported → {output_path}")
 
 
-def _format_excel_grid(writer: Any, sheet_name: str, grid: Any) -> None:
-    """Apply basic formatting to Excel grid: column widths, header bold."""
+def _write_grid_openpyxl(
+    output_path: Path,
+    rows: List[Tuple[str, str, str]],
+    shift_order: Optional[List[str]],
+) -> None:
+    """
+    Date × Shift grid for the openpyxl engine, streamed in write-only mode:
+    the pivot is built from (date, shift, staff) rows in one pass and every
+    cell is written once, already styled (header, bold date column, alternate
+    row shading), with column widths fixed up front. Same layout as the
+    pandas pivot_table + to_excel path.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    # Pivot: date → shift → [staff, ...] (rows arrive date-sorted)
+    grid: Dict[str, Dict[str, List[str]]] = {}
+    for date_str, shift_name, staff in rows:
+        grid.setdefault(date_str, {}).setdefault(shift_name, []).append(staff)
+    shifts = sorted({shift_name for _, shift_name, _ in rows})
+    if shift_order:
+        available = [s for s in shift_order if s in shifts]
+        rest = [s for s in shifts if s not in shift_order]
+        shifts = available + rest
+
+    header = ["Date"] + shifts
+    body = [
+        [date_str] + ["; ".join(cells[s]) if s in cells else None for s in shifts]
+        for date_str, cells in grid.items()
+    ]
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Schedule")
+    for col, title in enumerate(header):
+        lengths = [len(str(row[col])) for row in body if row[col]]
+        lengths.append(len(title))
+        ws.column_dimensions[get_column_letter(col + 1)].width = min(max(lengths) + 2, 30)
+
+    # Style objects are built once (_grid_styles) and shared by every cell
+    styles = _grid_styles()
+
+    def _cell(value: Any, kind: str) -> Any:
+        cell = WriteOnlyCell(ws, value=value)
+        for attr, style in styles[kind].items():
+            setattr(cell, attr, style)
+        return cell
+
+    ws.append([_cell(title, "header") for title in header])
+    for sheet_row, row in enumerate(body, start=2):
+        # Alternate row shading on even sheet rows
+        if sheet_row % 2 == 0:
+            cells = [_cell(row[0], "date_alt")]
+            cells.extend(_cell(value, "alt") for value in row[1:])
+        else:
+            cells = [_cell(row[0], "date")]
+            cells.extend(row[1:])
+        ws.append(cells)
+    wb.save(output_path)
+
+
+@lru_cache(maxsize=1)
+def _grid_styles() -> Dict[str, Dict[str, Any]]:
+    """Grid cell styles for _write_grid_openpyxl, built once per process."""
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    thin = Side(style="thin")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    alt_fill = PatternFill("solid", fgColor="EBF3FB")
+    date = {
+        "font": Font(bold=True),
+        "alignment": Alignment(horizontal="center", vertical="top"),
+        "border": border,
+    }
+    return {
+        "header": {
+            "font": Font(bold=True, color="FFFFFF"),
+            "fill": PatternFill("solid", fgColor="1F4E79"),
+            "alignment": Alignment(horizontal="center"),
+            "border": border,
+        },
+        "date": date,
+        "date_alt": dict(date, fill=alt_fill),
+        "alt": {"fill": alt_fill},
+    }
+
+
+def _excel_engine(engine: str) -> str:
+    """Return engine, or "openpyxl" if xlsxwriter was requested but is not installed."""
+    if engine == "xlsxwriter":
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            logger.warning("xlsxwriter not installed — using openpyxl for Excel export")
+            return "openpyxl"
+    return engine
+
+
+def _format_excel_grid_xlsxwriter(writer: Any, sheet_name: str, grid: Any) -> None:
+    """Grid formatting for the xlsxwriter engine (same header, widths and row shading as _write_grid_openpyxl)."""
     try:
-        from openpyxl.styles import Font, PatternFill, Alignment
         ws = writer.sheets[sheet_name]
-        header_fill = PatternFill("solid", fgColor="1F4E79")
-        header_font = Font(bold=True, color="FFFFFF")
-
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
-
-        for col in ws.columns:
-            max_len = max((len(str(c.value)) for c in col if c.value), default=8)
-            ws.column_dimensions[col[0].column_letter].width = min(max_len + 2, 30)
-
-        # Alternate row shading
-        from openpyxl.styles import PatternFill as PF
-        alt = PF("solid", fgColor="EBF3FB")
-        for i, row in enumerate(ws.iter_rows(min_row=2), start=2):
-            if i % 2 == 0:
-                for cell in row:
-                    cell.fill = alt
+        header_fmt = writer.book.add_format({
+            "bold": True, "font_color": "#FFFFFF", "bg_color": "#1F4E79", "align": "center",
+        })
+        alt_fmt = writer.book.add_format({"bg_color": "#EBF3FB", "pattern": 1})
+
+        headers = [grid.index.name or ""] + [str(c) for c in grid.columns]
+        for col, header in enumerate(headers):
+            ws.write(0, col, header, header_fmt)
+
+        columns = [grid.index] + [grid[c] for c in grid.columns]
+        for col, (header, values) in enumerate(zip(headers, columns)):
+            lengths = [len(str(v)) for v in values if isinstance(v, str) and v]
+            if header:
+                lengths.append(len(header))
+            ws.set_column(col, col, min(max(lengths, default=8) + 2, 30))
+
+        # Alternate row shading (even sheet rows, as in the openpyxl path)
+        if len(grid):
+            ws.conditional_format(1, 0, len(grid), len(headers) - 1, {
+                "type": "formula", "criteria": "=MOD(ROW(),2)=0", "format": alt_fmt,
+            })
 
     except Exception as e:
         logger.warning(f"Excel formatting failed (non-critical): {e}")
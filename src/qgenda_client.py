@@ -7,12 +7,34 @@ Documentation: https://restapi.qgenda.com/
 
 import requests
 import logging
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, date
 import time
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    _HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+except ImportError:   # optional — HTTP/2 transport, requests.Session otherwise
+    httpx = None
+    _HTTP_ERRORS = (requests.exceptions.RequestException,)
+
+try:
+    import ijson
+except ImportError:   # optional — streaming JSON parse, response.json() otherwise
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Per-request timeout (seconds) and retry budget, shared by the
+# requests.Session adapter and the optional httpx transport
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+
 
 class QGendaClient:
     """
@@ -23,7 +45,8 @@ class QGendaClient:
         self,
         api_key: str,
         company_key: str,
-        base_url: str = "https://api.qgenda.com/v2"
+        base_url: str = "https://api.qgenda.com/v2",
+        http2: bool = False
     ):
         """
         Initialize QGenda client
@@ -32,16 +55,59 @@ class QGendaClient:
             api_key: QGenda API key
             company_key: QGenda company key
             base_url: Base URL for QGenda API
+            http2: Send requests through an httpx HTTP/2 client, multiplexing
+                   concurrent uploads over one TLS connection (needs
+                   httpx[http2]; falls back to requests.Session otherwise)
         """
         self.api_key = api_key
         self.company_key = company_key
         self.base_url = base_url.rstrip('/')
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        headers = {
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json'
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        # Pooled keep-alive connections sized for update_schedule's workers.
+        # Retry's default allowed_methods leave POST out, so a retried upload
+        # can never create a duplicate entry.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Transport used by the API methods: the session, or an HTTP/2 client
+        self._client = self.session
+        if http2:
+            if httpx is None:
+                logger.warning("httpx not installed — using requests.Session (HTTP/1.1)")
+            else:
+                try:
+                    self._client = httpx.Client(
+                        headers=headers,
+                        timeout=REQUEST_TIMEOUT,
+                        transport=httpx.HTTPTransport(
+                            http2=True,
+                            retries=MAX_RETRIES,   # connection failures only
+                            limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+                        ),
+                    )
+                except ImportError:   # httpx without the h2 extra
+                    logger.warning("h2 not installed — using requests.Session (HTTP/1.1)")
+    
+    def close(self) -> None:
+        """Close pooled connections (session and HTTP/2 client)."""
+        if self._client is not self.session:
+            self._client.close()
+        self.session.close()
     
     def get_schedule(
         self,
@@ -72,14 +138,14 @@ class QGendaClient:
         logger.info(f"Fetching schedule from {start_date} to {end_date}")
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._client.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
             logger.info(f"Retrieved {len(data)} schedule entries")
             return data
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error fetching schedule: {e}")
             raise
     
@@ -99,14 +165,14 @@ class QGendaClient:
         logger.info("Fetching staff list")
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._client.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
             logger.info(f"Retrieved {len(data)} staff members")
             return data
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error fetching staff: {e}")
             raise
     
@@ -136,17 +202,77 @@ class QGendaClient:
         logger.info(f"Fetching time-off from {start_date} to {end_date}")
         
         try:
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._client.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
             logger.info(f"Retrieved {len(data)} time-off entries")
             return data
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error fetching time-off: {e}")
             raise
     
+    def get_schedule_iter(
+        self,
+        start_date: str,
+        end_date: str,
+        include_open_shifts: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Stream schedule entries one at a time (see get_schedule).
+        
+        With ijson installed the JSON array is parsed incrementally from the
+        response, so the full entry list is never held in memory.
+        """
+        params = {
+            'companyKey': self.company_key,
+            'startDate': start_date,
+            'endDate': end_date,
+            'includeOpenShifts': include_open_shifts
+        }
+        logger.info(f"Streaming schedule from {start_date} to {end_date}")
+        return self._iter_entries(f"{self.base_url}/schedule", params, "schedule")
+    
+    def get_time_off_iter(self, start_date: str, end_date: str) -> Iterator[Dict]:
+        """Stream time-off entries one at a time (see get_time_off)."""
+        params = {
+            'companyKey': self.company_key,
+            'startDate': start_date,
+            'endDate': end_date
+        }
+        logger.info(f"Streaming time-off from {start_date} to {end_date}")
+        return self._iter_entries(f"{self.base_url}/timeoff", params, "time-off")
+    
+    def _iter_entries(self, endpoint: str, params: Dict, label: str) -> Iterator[Dict]:
+        """
+        Yield the items of a JSON-array response. Streams through ijson on
+        the requests session; the httpx client (or no ijson) falls back to
+        response.json().
+        """
+        count = 0
+        try:
+            if ijson is not None and self._client is self.session:
+                with self.session.get(
+                    endpoint, params=params, timeout=REQUEST_TIMEOUT, stream=True
+                ) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True   # undo gzip before parsing
+                    for entry in ijson.items(response.raw, 'item', use_float=True):
+                        count += 1
+                        yield entry
+            else:
+                response = self._client.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                for entry in response.json():
+                    count += 1
+                    yield entry
+            logger.info(f"Retrieved {count} {label} entries")
+            
+        except _HTTP_ERRORS as e:
+            logger.error(f"Error fetching {label}: {e}")
+            raise
+    
     def create_schedule_entry(
         self,
         staff_key: str,
@@ -185,14 +311,14 @@ class QGendaClient:
         logger.info(f"Creating schedule entry: {staff_key} -> {task_key} on {date}")
         
         try:
-            response = self.session.post(endpoint, json=payload, timeout=30)
+            response = self._client.post(endpoint, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
             logger.info(f"Created schedule entry successfully")
             return data
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error creating schedule entry: {e}")
             raise
     
@@ -201,30 +327,33 @@ class QGendaClient:
         schedule: Dict[str, List[str]],
         task_mapping: Dict[str, str],
         staff_mapping: Dict[str, str],
-        rate_limit_delay: float = 0.5
+        rate_limit_delay: float = 0.5,
+        max_workers: int = 8
     ) -> List[Dict]:
         """
         Batch update schedule entries
         
+        Uploads run on a small thread pool; rate_limit_delay spaces request
+        starts globally (at most one request per delay across all workers)
+        instead of sleeping after every request.
+        
         Args:
             schedule: Schedule dict from scheduling engine
             task_mapping: Map shift names to QGenda task keys
             staff_mapping: Map staff names to QGenda staff keys
-            rate_limit_delay: Delay between requests (seconds)
+            rate_limit_delay: Minimum interval between request starts (seconds)
+            max_workers: Concurrent upload threads
             
         Returns:
-            List of created entries
+            List of created entries, in schedule order
         """
-        results = []
         total = sum(len(assignments) for assignments in schedule.values())
-        count = 0
         
         logger.info(f"Uploading {total} schedule entries to QGenda")
         
+        entries = []
         for date_str, assignments in schedule.items():
             for shift_num, person_name in enumerate(assignments):
-                count += 1
-                
                 # Get QGenda keys
                 staff_key = staff_mapping.get(person_name)
                 # Assume shift naming convention like "Mercy 0", "Mercy 1"
@@ -237,21 +366,37 @@ class QGendaClient:
                     )
                     continue
                 
-                try:
-                    result = self.create_schedule_entry(
-                        staff_key=staff_key,
-                        task_key=task_key,
-                        date=date_str
-                    )
-                    results.append(result)
-                    
-                    logger.info(f"Progress: {count}/{total}")
-                    
-                    # Rate limiting
-                    time.sleep(rate_limit_delay)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to upload {person_name} on {date_str}: {e}")
+                entries.append((staff_key, task_key, date_str, person_name))
+        
+        # Global rate limit: each request claims the next start slot
+        lock = threading.Lock()
+        next_slot = time.monotonic()
+        done = 0
+        
+        def upload(entry):
+            nonlocal next_slot, done
+            staff_key, task_key, date_str, person_name = entry
+            with lock:
+                now = time.monotonic()
+                start = max(now, next_slot)
+                next_slot = start + rate_limit_delay
+            time.sleep(start - now)
+            try:
+                result = self.create_schedule_entry(
+                    staff_key=staff_key,
+                    task_key=task_key,
+                    date=date_str
+                )
+            except Exception as e:
+                logger.error(f"Failed to upload {person_name} on {date_str}: {e}")
+                return False, None
+            with lock:
+                done += 1
+                logger.info(f"Progress: {done}/{total}")
+            return True, result
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            results = [result for ok, result in pool.map(upload, entries) if ok]
         
         logger.info(f"Successfully uploaded {len(results)}/{total} entries")
         return results
@@ -275,13 +420,13 @@ class QGendaClient:
         logger.info(f"Deleting schedule entry {schedule_key}")
         
         try:
-            response = self.session.delete(endpoint, params=params, timeout=30)
+            response = self._client.delete(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             logger.info("Deleted schedule entry successfully")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Error deleting schedule entry: {e}")
             return False
 
@@ -298,11 +443,9 @@ def extract_vacation_data(client: QGendaClient, start_date: str, end_date: str)
     Returns:
         Dictionary mapping dates to list of unavailable staff
     """
-    time_off = client.get_time_off(start_date, end_date)
-    
     vacation_map = {}
     
-    for entry in time_off:
+    for entry in client.get_time_off_iter(start_date, end_date):
         # Extract staff name and date
         # Adjust field names based on actual QGenda API response
         staff_name = f"{entry.get('FirstName', '')} {entry.get('LastName', '')}"
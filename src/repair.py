@@ -253,9 +253,13 @@ def try_repair_slot(
     else:
         return False
 
+    if not relaxed:
+        # Only hard violations decide acceptance; stop at the first one.
+        return not checker.any_hard_violation(schedule_copy)
+
     hard, _soft = checker.check_all(schedule_copy, weekend_dates=weekend_dates)
 
-    if relaxed and hard:
+    if hard:
         hard = [
             v for v in hard
             if not (
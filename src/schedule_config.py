@@ -65,7 +65,7 @@ IR-CALL WEEKEND MIRROR:
 """
 
 import re
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # ---------------------------------------------------------------------------
 # QGenda task name → engine shift code
@@ -705,6 +705,11 @@ SCHEDULING_BLOCKS: List[Dict[str, Any]] = [
      "interactive_prompt": "Schedule Weekend PET?"},
 ]
 
+# Run order for schedule_blocks' default, sorted once at import
+SCHEDULING_BLOCKS_SORTED: Tuple[Dict[str, Any], ...] = tuple(
+    sorted(SCHEDULING_BLOCKS, key=lambda b: b["priority"])
+)
+
 # ---------------------------------------------------------------------------
 # Cursor state keys — all blocks need an entry in cursor_state.json
 # ---------------------------------------------------------------------------
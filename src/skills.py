@@ -6,7 +6,8 @@ Uses regex-based task name normalization (normalize_task_name) so raw
 QGenda strings are mapped before checking qualifications.
 """
 
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 from src.schedule_config import SHIFT_DEFINITIONS, normalize_task_name
 
 
@@ -94,13 +95,40 @@ def is_rotational_subspecialty(shift_name: str) -> bool:
     return normalize_task_name(shift_name) in ROTATIONAL_SUBSPECIALTY_SHIFTS
 
 
+# Roster-audit results depend only on each person's name and subspecialty
+# tags, so they are memoized on that projection of the roster.
+RosterKey = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def _roster_key(roster: List[Dict[str, Any]]) -> RosterKey:
+    return tuple(
+        (p["name"], tuple(p.get("subspecialties", []))) for p in roster
+    )
+
+
+def _roster_from_key(key: RosterKey) -> List[Dict[str, Any]]:
+    return [{"name": name, "subspecialties": list(specs)} for name, specs in key]
+
+
+def reset_cache() -> None:
+    """Drop memoized get_subspecialty_summary / validate_shift_coverage results."""
+    _subspecialty_summary_cached.cache_clear()
+    _shift_coverage_cached.cache_clear()
+
+
 def get_subspecialty_summary(roster: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     """Return {tag: [name, ...]} map for roster audit."""
+    cached = _subspecialty_summary_cached(_roster_key(roster))
+    return {tag: list(names) for tag, names in cached.items()}
+
+
+@lru_cache(maxsize=8)
+def _subspecialty_summary_cached(key: RosterKey) -> Dict[str, List[str]]:
     summary: Dict[str, List[str]] = {}
-    for p in roster:
-        for spec in p.get("subspecialties", []):
+    for name, specs in key:
+        for spec in specs:
             tag = spec.strip()
-            summary.setdefault(tag, []).append(p["name"])
+            summary.setdefault(tag, []).append(name)
     return summary
 
 
@@ -112,9 +140,19 @@ def validate_shift_coverage(
     Check that every rotation-managed shift has ≥1 qualified radiologist.
     Outpatient-only and concurrent-fixed shifts are skipped.
     """
+    shifts = None if shifts_to_check is None else tuple(shifts_to_check)
+    return list(_shift_coverage_cached(_roster_key(roster), shifts))
+
+
+@lru_cache(maxsize=8)
+def _shift_coverage_cached(
+    key: RosterKey,
+    shifts_to_check: Optional[Tuple[str, ...]],
+) -> List[str]:
     if shifts_to_check is None:
-        shifts_to_check = list(SHIFT_SUBSPECIALTY_MAP.keys())
+        shifts_to_check = tuple(SHIFT_SUBSPECIALTY_MAP.keys())
 
+    roster = _roster_from_key(key)
     warnings = []
     skip = OUTPATIENT_ONLY_SHIFTS | FIXED_ASSIGNMENT_SHIFTS
     for shift in shifts_to_check:
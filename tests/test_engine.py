@@ -12,7 +12,12 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.engine import schedule_period, schedule_weekday_mercy, calculate_fairness_metrics
+from src.engine import (
+    schedule_period, schedule_weekday_mercy, calculate_fairness_metrics, update_fairness_metrics,
+    get_date_lists, get_weekday_dates, get_saturday_dates, get_weekend_dates,
+    schedule_profile, SHIFT_PROFILES, calculate_fairness_metrics_batch, prepare_people,
+    filter_pool_for_block,
+)
 from src.config import load_roster, load_vacation_map, filter_pool, get_shift_weight
 
 
@@ -59,6 +64,36 @@ class TestSchedulePeriod:
         assert "Alice" not in names
         assert len(names) == 2
 
+    def test_profile_dispatch(self, sample_people):
+        """schedule_profile runs the SHIFT_PROFILES entry; min_pool is enforced"""
+        dates = [date(2026, 3, 2), date(2026, 3, 3)]
+        schedule, _ = schedule_profile("ir_weekday", sample_people, dates)
+        assert [s for s, _ in schedule["2026-03-02"]] == SHIFT_PROFILES["ir_weekday"]["shift_names"]
+        assert schedule_profile("weekday_mercy", sample_people, dates) == \
+            schedule_weekday_mercy(sample_people, dates)
+        with pytest.raises(ValueError, match="IR pool has only 1"):
+            schedule_profile("ir_weekday", sample_people[:1], dates)
+
+    def test_fractional_weights_do_not_drift(self, sample_people):
+        """100 × 0.81 lands on exactly 81 (float summation overshoots)"""
+        dates = [date(2026, 3, 1) + timedelta(days=i) for i in range(100)]
+        _, cursor = schedule_period(
+            people=sample_people,
+            dates=dates,
+            shifts_per_period=1,
+            shift_names=["M"],
+            shift_weights={"M": 0.81},
+        )
+        assert cursor == 81.0
+
+    def test_prepared_pool_matches(self, sample_people):
+        """A prepare_people result reused across calls gives the same schedule"""
+        dates = [date(2026, 3, 2), date(2026, 3, 3)]
+        prepared = prepare_people(sample_people[::-1])
+        for cursor in (0, 1.5, 4):
+            assert schedule_profile("weekday_mercy", sample_people, dates, cursor) == \
+                schedule_profile("weekday_mercy", sample_people, dates, cursor, prepared=prepared)
+
 
 class TestShiftWeights:
     """Test weighted cursor (M0=0.25, M1=1.0)"""
@@ -91,3 +126,125 @@ class TestFairnessMetrics:
         assert "cv" in metrics
         assert "counts" in metrics
         assert "weighted_counts" in metrics
+
+    def test_update_matches_recompute_after_fill(self):
+        schedule = {
+            "2026-03-01": [("M0", "Alice"), ("M1", "UNFILLED")],
+            "2026-03-02": [("EP", "UNFILLED"), ("M1", "Alice")],
+        }
+        people = [
+            {"name": "Alice", "index": 0},
+            {"name": "Bob", "index": 1},
+            {"name": "Carol", "index": 2},
+        ]
+        before = calculate_fairness_metrics(schedule, people)
+        schedule["2026-03-01"][1] = ("M1", "Bob")
+        schedule["2026-03-02"][0] = ("EP", "Carol")
+        updated = update_fairness_metrics(before, people, [("M1", "Bob"), ("EP", "Carol")])
+        fresh = calculate_fairness_metrics(schedule, people)
+        assert updated["unfilled"] == fresh["unfilled"] == 0
+        assert updated["counts"] == fresh["counts"]
+        assert updated["per_shift"] == fresh["per_shift"]
+        for key in ("mean", "std", "cv", "hours_mean", "hours_cv"):
+            assert updated[key] == pytest.approx(fresh[key])
+        assert before["unfilled"] == 2
+
+    def test_summary_values(self):
+        schedule = {
+            "2026-03-02": [("M1", "Alice"), ("M2", "Bob")],
+            "2026-03-03": [("M1", "Alice")],
+        }
+        people = [
+            {"name": "Alice", "index": 0},
+            {"name": "Bob", "index": 1},
+            {"name": "Carol", "index": 2},
+        ]
+        weights = {"M1": 1.0, "M2": 1.0}
+        metrics = calculate_fairness_metrics(schedule, people, shift_weights=weights)
+        assert metrics["mean"] == pytest.approx(1.0)
+        assert metrics["std"] == pytest.approx((2 / 3) ** 0.5)
+        assert metrics["cv"] == pytest.approx(100 * (2 / 3) ** 0.5)
+        assert (metrics["min"], metrics["max"]) == (0.0, 2.0)
+        # M1: [2, 0, 0] → mean 2/3, std sqrt(8/9)
+        assert metrics["per_shift_cv"]["M1"] == pytest.approx(100 * (8 / 9) ** 0.5 / (2 / 3))
+
+    def test_vector_summary_matches_sum_passes(self, monkeypatch):
+        """NumPy reductions agree with the sum() passes; the latter are exact"""
+        import math
+        import src.engine as engine
+
+        names = [f"P{i}" for i in range(7)]
+        people = [{"name": n, "index": i} for i, n in enumerate(names)]
+        schedule = {
+            f"2026-03-{d:02d}": [("M1", names[d % 7]), ("EP", names[(d * 3) % 5]), ("M0", "UNFILLED")]
+            for d in range(1, 29)
+        }
+        schedule["2026-03-02"].append(("M2", "Locum"))
+
+        monkeypatch.setattr(engine, "VECTOR_FAIRNESS_MIN_PEOPLE", 10**12)
+        scalar = calculate_fairness_metrics(schedule, people)
+        monkeypatch.setattr(engine, "VECTOR_FAIRNESS_MIN_PEOPLE", 0)
+        vector = calculate_fairness_metrics(schedule, people)
+
+        assert scalar.keys() == vector.keys()
+        for key in ("mean", "std", "cv", "hours_mean", "hours_std", "hours_cv"):
+            assert vector[key] == pytest.approx(scalar[key]), key
+        assert vector["per_shift_cv"] == pytest.approx(scalar["per_shift_cv"])
+
+        values = list(scalar["hours_counts"].values())
+        mean = sum(values) / len(values)
+        assert scalar["hours_mean"] == mean
+        assert scalar["hours_std"] == math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+
+    def test_batch_matches_single(self):
+        people = [{"name": n, "index": i} for i, n in enumerate(["Alice", "Bob", "Carol"])]
+        schedules = [
+            {"2026-03-02": [("M1", "Alice"), ("EP", "Bob")], "2026-03-03": [("M0", "UNFILLED")]},
+            {"2026-03-02": [("M3", "Carol"), ("M1", "Locum")]},
+            {},
+        ]
+        batch = calculate_fairness_metrics_batch(schedules, people)
+        assert len(batch) == len(schedules)
+        for got, schedule in zip(batch, schedules):
+            want = calculate_fairness_metrics(schedule, people)
+            assert got.keys() == want.keys()
+            for key, value in want.items():
+                if key == "per_shift":
+                    assert got[key] == value
+                else:
+                    assert got[key] == pytest.approx(value), key
+        assert calculate_fairness_metrics_batch([], people) == []
+
+    def test_empty_roster(self):
+        metrics = calculate_fairness_metrics({"2026-03-02": [("M1", "UNFILLED")]}, [])
+        assert (metrics["mean"], metrics["std"], metrics["cv"]) == (0.0, 0.0, 0.0)
+        assert (metrics["min"], metrics["max"], metrics["hours_cv"]) == (0, 0, 0.0)
+        assert metrics["unfilled"] == 1
+
+
+class TestDateLists:
+
+    def test_get_date_lists_matches_individual_helpers(self):
+        start, end = date(2026, 2, 26), date(2026, 4, 7)
+        weekdays, saturdays, weekends = get_date_lists(start, end)
+        assert weekdays == get_weekday_dates(start, end)
+        assert saturdays == get_saturday_dates(start, end)
+        assert weekends == get_weekend_dates(start, end)
+
+    def test_get_date_lists_empty_range(self):
+        assert get_date_lists(date(2026, 3, 2), date(2026, 3, 1)) == ([], [], [])
+
+
+class TestPoolFilter:
+
+    def test_tracks_roster_edits(self):
+        roster = [
+            {"name": "Alice", "index": 0, "participates_mercy": True},
+            {"name": "Bob", "index": 1, "participates_mercy": False},
+        ]
+        block = {"config": {"pool_filter": "participates_mercy"}}
+        assert [p["name"] for p in filter_pool_for_block(roster, block)] == ["Alice"]
+        roster.append({"name": "Carol", "index": 2, "participates_mercy": True})
+        assert [p["name"] for p in filter_pool_for_block(roster, block)] == ["Alice", "Carol"]
+        roster[1]["participates_mercy"] = True
+        assert [p["name"] for p in filter_pool_for_block(roster, block)] == ["Alice", "Bob", "Carol"]
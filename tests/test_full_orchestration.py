@@ -129,6 +129,13 @@ class TestRosterValidation:
         overlap = expected_non_ir & ir_initials
         assert not overlap, f"Non-IR staff found in IR pool: {overlap}"
 
+    def test_cached_roster_load_returns_independent_copy(self):
+        first = load_roster()
+        first[0]["subspecialties"].append("mutated")
+        second = load_roster()
+        assert "mutated" not in second[0]["subspecialties"]
+        assert second == load_roster()
+
     def test_ir_pool_size(self, ir_pool):
         assert len(ir_pool) == 4, f"Expected 4 IR radiologists, got {len(ir_pool)}"
 
@@ -171,6 +178,19 @@ class TestSubspecialtyParsing:
         warnings = validate_shift_coverage(roster, shifts_to_check=["IR-1", "IR-2", "Skull Base", "Cardiac"])
         assert not warnings, f"Shift coverage gaps: {warnings}"
 
+    def test_roster_audit_cache_tracks_roster_edits(self, roster):
+        summary = get_subspecialty_summary(roster)
+        summary["ir"].append("Mutated")
+        assert "Mutated" not in get_subspecialty_summary(roster)["ir"]
+
+        no_ir = [
+            {**p, "subspecialties": [s for s in p.get("subspecialties", []) if s.lower() != "ir"]}
+            for p in roster
+        ]
+        assert "ir" not in get_subspecialty_summary(no_ir)
+        assert validate_shift_coverage(no_ir, shifts_to_check=["IR-1"])
+        assert not validate_shift_coverage(roster, shifts_to_check=["IR-1"])
+
 
 # ============================================================
 # Section 3: Block scheduling
@@ -289,6 +309,159 @@ class TestConstraintChecking:
         errors, warnings = checker.validate_roster()
         assert not errors, f"Roster validation errors: {errors}"
 
+    def test_any_hard_violation_agrees_with_check_all(self, schedule_and_checker):
+        schedule, checker = schedule_and_checker
+        hard, _ = checker.check_all(schedule)
+        assert checker.any_hard_violation(schedule) == bool(hard)
+        bad = {d: list(a) for d, a in schedule.items()}
+        first = next(iter(bad))
+        name = next(n for _, n in bad[first] if n != "UNFILLED")
+        bad[first].append(("IR-CALL", name))
+        bad[first].append(("IR-CALL", name))
+        assert checker.check_all(bad)[0]
+        assert checker.any_hard_violation(bad)
+
+    def test_check_all_fail_fast(self, schedule_and_checker):
+        schedule, checker = schedule_and_checker
+        bad = {d: list(a) for d, a in schedule.items()}
+        first = next(iter(bad))
+        name = next(n for _, n in bad[first] if n != "UNFILLED")
+        bad[first] += [("IR-CALL", name), ("IR-CALL", name)]
+        full_hard, _ = checker.check_all(bad)
+        hard, soft = checker.check_all(bad, fail_fast=True)
+        assert len(hard) == 1 and soft == []
+        assert str(hard[0]) in {str(v) for v in full_hard}
+
+    def test_update_matches_full_check(self, schedule, roster, vacation_map, saturday_dates):
+        checker = ConstraintChecker(roster=roster, vacation_map=vacation_map)
+        work = {d: list(a) for d, a in schedule.items()}
+        checker.check_all(work, weekend_dates=saturday_dates)
+        first = next(iter(work))
+        name = next(n for _, n in work[first] if n != "UNFILLED")
+        work[first] = work[first] + [("IR-CALL", name), ("IR-CALL", name)]
+        inc = checker.update(work, {first}, weekend_dates=saturday_dates)
+        full = ConstraintChecker(roster=roster, vacation_map=vacation_map).check_all(
+            work, weekend_dates=saturday_dates,
+        )
+        assert [str(v) for v in inc[0]] == [str(v) for v in full[0]]
+        assert [str(v) for v in inc[1]] == [str(v) for v in full[1]]
+        assert inc[0]
+
+    def test_check_all_cache_returns_fresh_lists(self, schedule_and_checker):
+        schedule, checker = schedule_and_checker
+        hard1, soft1 = checker.check_all(schedule)
+        soft1.append(None)
+        hard2, soft2 = checker.check_all(schedule)
+        assert None not in soft2
+        assert [str(v) for v in hard1] == [str(v) for v in hard2]
+
+    def test_check_batch_matches_check_all(self, schedule_and_checker, saturday_dates, monkeypatch):
+        import src.constraints as constraints
+
+        schedule, checker = schedule_and_checker
+        # Small batch: force the process-pool path
+        monkeypatch.setattr(constraints, "BATCH_PARALLEL_MIN_ASSIGNMENTS", 0)
+        first = next(iter(schedule))
+        variants = []
+        for shift_name, name in schedule[first][:4]:
+            bad = {d: list(a) for d, a in schedule.items()}
+            bad[first].append(("IR-CALL", name))
+            variants.append(bad)
+        batch = checker.check_batch(variants, weekend_dates=saturday_dates, max_workers=2)
+        assert len(batch) == len(variants)
+        for (hard, soft), sched in zip(batch, variants):
+            exp_hard, exp_soft = checker.check_all(sched, weekend_dates=saturday_dates)
+            assert [str(v) for v in hard] == [str(v) for v in exp_hard]
+            assert [str(v) for v in soft] == [str(v) for v in exp_soft]
+
+    def test_numba_sweep_matches_python_sweep(self, schedule, roster, vacation_map, monkeypatch):
+        pytest.importorskip("numba")
+        import src.constraints as constraints
+        checker = ConstraintChecker(roster=roster, vacation_map=vacation_map)
+        # Inject one violation of each per-assignment type
+        ir_person = next(p["name"] for p in roster if p.get("participates_ir"))
+        non_ir = next(p["name"] for p in roster if not p.get("participates_ir")
+                      and "ir" not in checker._person_specs[p["name"]])
+        bad = {d: list(a) for d, a in schedule.items()}
+        first = next(iter(bad))
+        bad[first] += [("M0", ir_person), ("IR-1", non_ir), ("M1", non_ir), ("M2", non_ir)]
+        filled, _ = constraints._partition_unfilled(bad)
+
+        monkeypatch.setattr(constraints, "NUMBA_SWEEP_MIN_ASSIGNMENTS", 10**12)
+        py = checker._fused_hard_sweep(filled)
+        monkeypatch.setattr(constraints, "NUMBA_SWEEP_MIN_ASSIGNMENTS", 0)
+        nb = checker._fused_hard_sweep(filled)
+        assert {k: [str(v) for v in vs] for k, vs in py.items()} == \
+               {k: [str(v) for v in vs] for k, vs in nb.items()}
+        assert py["MERCY_POOL_GATE"] and py["IR_POOL_GATE"] and py["DOUBLE_BOOKING"]
+
+    def test_public_checks_match_fused_sweep(self, schedule, roster, vacation_map):
+        import src.constraints as constraints
+        checker = ConstraintChecker(roster=roster, vacation_map=vacation_map)
+        ir_person = next(p["name"] for p in roster if p.get("participates_ir"))
+        non_ir = next(p["name"] for p in roster if not p.get("participates_ir")
+                      and "ir" not in checker._person_specs[p["name"]])
+        vac_date, vac_people = next((d, names) for d, names in vacation_map.items() if names)
+        # One violation of every fused type, next to UNFILLED and off-roster slots
+        bad = {d: list(a) for d, a in schedule.items()}
+        first = next(iter(bad))
+        bad[first] += [
+            ("M0", ir_person),              # MERCY_POOL_GATE
+            ("EP", ir_person),              # WEEKEND_POOL_GATE
+            ("IR-1", non_ir),               # IR_POOL_GATE + SUBSPECIALTY_MISMATCH
+            ("M1", non_ir),                 # DOUBLE_BOOKING (with IR-1)
+            ("IR-2", "Locum Person"),
+            ("M2", "UNFILLED"),
+        ]
+        bad.setdefault(vac_date, []).append(("M3", vac_people[0]))   # VACATION
+        filled, _ = constraints._partition_unfilled(bad)
+        fused = checker._fused_hard_sweep(filled)
+
+        public = {
+            "VACATION": checker.check_vacation,
+            "DOUBLE_BOOKING": checker.check_double_booking,
+            "SUBSPECIALTY_MISMATCH": checker.check_subspecialty_qualification,
+            "IR_POOL_GATE": checker.check_ir_pool_gate,
+            "MERCY_POOL_GATE": checker.check_mercy_pool_gate,
+            "WEEKEND_POOL_GATE": checker.check_weekend_pool_gate,
+        }
+        assert set(public) == set(fused)
+        for vtype, check in public.items():
+            assert fused[vtype], vtype
+            assert [str(v) for v in check(bad)] == [str(v) for v in fused[vtype]], vtype
+
+    def test_vector_b2b_matches_python_b2b(self, roster, vacation_map, monkeypatch):
+        import src.constraints as constraints
+        checker = ConstraintChecker(roster=roster, vacation_map=vacation_map)
+        names = [p["name"] for p in roster]
+        sats = [(date(2026, 3, 7) + timedelta(weeks=w)).isoformat() for w in range(6)]
+        # Roster names out of roster order, a person twice on one weekend,
+        # UNFILLED slots, and two locums first seen in the opposite order
+        # to their back-to-back runs
+        sched = {
+            sats[0]: [("EP", names[5]), ("LP", names[1]), ("Dx-CALL", "Locum B"), ("M0_WEEKEND", "UNFILLED")],
+            sats[1]: [("EP", names[1]), ("LP", names[5]), ("Dx-CALL", names[5]), ("M0_WEEKEND", "Locum A")],
+            sats[2]: [("EP", "Locum A"), ("LP", names[0]), ("Dx-CALL", "UNFILLED")],
+            sats[3]: [("EP", names[0]), ("LP", "Locum B")],
+            sats[4]: [("EP", "Locum B"), ("LP", names[1]), ("Dx-CALL", names[0])],
+            sats[5]: [("EP", names[1]), ("LP", "Locum A")],
+        }
+        weekends = sats[::-1]
+
+        monkeypatch.setattr(constraints, "VECTOR_B2B_MIN_CELLS", 10**12)
+        py = checker.check_back_to_back_weekend(sched, weekends)
+        monkeypatch.setattr(constraints, "VECTOR_B2B_MIN_CELLS", 0)
+        vec = checker.check_back_to_back_weekend(sched, weekends)
+
+        assert [str(v) for v in py] == [str(v) for v in vec]
+        assert [(v.date, v.staff) for v in py] == [
+            (sats[1], names[1]), (sats[1], names[5]),
+            (sats[2], "Locum A"),
+            (sats[3], names[0]),
+            (sats[4], names[0]), (sats[4], "Locum B"),
+            (sats[5], names[1]),
+        ]
+
 
 # ============================================================
 # Section 5: Fairness metrics
@@ -405,6 +578,19 @@ class TestExportLayer:
         assert xlsx_p.exists()
         assert xlsx_p.stat().st_size > 1000
 
+    def test_excel_xlsxwriter_engine_matches_openpyxl(self, tmp_path):
+        pytest.importorskip("xlsxwriter")
+        import pandas as pd
+        schedule = {
+            "2026-03-02": [("M0", "Alice"), ("M1", "Bob"), ("IR-1", "Carol")],
+            "2026-03-03": [("M0", "Bob"), ("M1", "Alice")],
+        }
+        fast_p = tmp_path / "schedule_fast.xlsx"
+        slow_p = tmp_path / "schedule_slow.xlsx"
+        export_to_excel(schedule, fast_p, engine="xlsxwriter")
+        export_to_excel(schedule, slow_p)
+        assert pd.read_excel(fast_p).equals(pd.read_excel(slow_p))
+
     def test_report_exists_and_contains_cv(self, full_output):
         _, _, report_p, _ = full_output
         assert report_p.exists()
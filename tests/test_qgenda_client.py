@@ -0,0 +1,263 @@
+"""
+tests/test_qgenda_client.py — QGendaClient against a mocked HTTP session.
+
+Tests: update_schedule concurrency (global rate limit, failed uploads,
+result order); the optional httpx HTTP/2 transport and its fallback;
+ijson streaming of schedule / time-off entries vs response.json().
+No network access: session methods are replaced per test.
+"""
+
+import gzip
+import io
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+requests = pytest.importorskip("requests")
+
+import src.qgenda_client as qgenda_client
+from src.qgenda_client import MAX_RETRIES, REQUEST_TIMEOUT, QGendaClient, extract_vacation_data
+
+
+# ---------------------------------------------------------------------------
+# Fixtures / helpers
+# ---------------------------------------------------------------------------
+
+class _Response:
+    """Minimal stand-in for a requests.Response carrying a JSON payload."""
+
+    def __init__(self, payload=None, status_error=None):
+        self._payload = payload
+        self._status_error = status_error
+
+    def raise_for_status(self):
+        if self._status_error is not None:
+            raise self._status_error
+
+    def json(self):
+        return self._payload
+
+
+class _StreamedResponse(_Response):
+    """Response whose .raw is a gzip-encoded urllib3 stream of `body`."""
+
+    def __init__(self, body: bytes):
+        from urllib3 import HTTPResponse
+
+        super().__init__(json.loads(body))
+        self.raw = HTTPResponse(
+            body=io.BytesIO(gzip.compress(body)),
+            headers={"Content-Encoding": "gzip"},
+            preload_content=False,
+            decode_content=False,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def client():
+    c = QGendaClient(api_key="key", company_key="company")
+    yield c
+    c.close()
+
+
+# Two dates × three Mercy shifts; staff keys are "s-<name>"
+SCHEDULE = {
+    "2026-03-02": ["Alice", "Bob", "Carol"],
+    "2026-03-03": ["Dave", "Erin", "Frank"],
+}
+STAFF = {name: f"s-{name}" for names in SCHEDULE.values() for name in names}
+TASKS = {f"Mercy {i}": f"t{i}" for i in range(3)}
+
+
+# ---------------------------------------------------------------------------
+# update_schedule
+# ---------------------------------------------------------------------------
+
+class TestUpdateSchedule:
+
+    def test_rate_limit_is_global_across_workers(self, client, monkeypatch):
+        """Request starts are spaced by rate_limit_delay even with parallel workers"""
+        lock = threading.Lock()
+        starts, in_flight, peak = [], [0], [0]
+
+        def post(url, json=None, timeout=None):
+            with lock:
+                starts.append(time.monotonic())
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.15)
+            with lock:
+                in_flight[0] -= 1
+            return _Response({"Key": json["StaffKey"]})
+
+        monkeypatch.setattr(client.session, "post", post)
+        delay = 0.04
+        t0 = time.monotonic()
+        results = client.update_schedule(SCHEDULE, TASKS, STAFF, rate_limit_delay=delay, max_workers=4)
+
+        assert len(results) == 6
+        # The i-th request may not start before its i-th slot
+        for i, started in enumerate(sorted(starts)):
+            assert started - t0 >= i * delay - 1e-3
+        # ...but requests still overlap instead of running one at a time
+        assert peak[0] > 1
+
+    def test_failed_upload_is_logged_and_skipped(self, client, monkeypatch, caplog):
+        """One failing POST doesn't cancel the others; the error is logged"""
+        def post(url, json=None, timeout=None):
+            if json["StaffKey"] == "s-Bob":
+                return _Response(status_error=requests.HTTPError("503 Server Error"))
+            return _Response({"Key": json["StaffKey"]})
+
+        monkeypatch.setattr(client.session, "post", post)
+        with caplog.at_level("ERROR", logger="src.qgenda_client"):
+            results = client.update_schedule(SCHEDULE, TASKS, STAFF, rate_limit_delay=0)
+
+        assert [r["Key"] for r in results] == ["s-Alice", "s-Carol", "s-Dave", "s-Erin", "s-Frank"]
+        assert "Failed to upload Bob on 2026-03-02" in caplog.text
+        assert "503 Server Error" in caplog.text
+
+    def test_results_keep_schedule_order(self, client, monkeypatch):
+        """Later entries finishing first doesn't reorder the results"""
+        order = [name for names in SCHEDULE.values() for name in names]
+
+        def post(url, json=None, timeout=None):
+            # Earlier entries take longer, so completion order is reversed
+            time.sleep(0.02 * (len(order) - order.index(json["StaffKey"][2:])))
+            return _Response({"Key": json["StaffKey"], "Date": json["Date"], "Task": json["TaskKey"]})
+
+        monkeypatch.setattr(client.session, "post", post)
+        results = client.update_schedule(SCHEDULE, TASKS, STAFF, rate_limit_delay=0, max_workers=6)
+
+        assert [(r["Date"], r["Task"], r["Key"]) for r in results] == [
+            (date_str, f"t{i}", f"s-{name}")
+            for date_str, names in SCHEDULE.items()
+            for i, name in enumerate(names)
+        ]
+
+
+# ---------------------------------------------------------------------------
+# HTTP/2 transport
+# ---------------------------------------------------------------------------
+
+class TestHttp2Transport:
+
+    def test_falls_back_without_httpx(self, monkeypatch, caplog):
+        monkeypatch.setattr(qgenda_client, "httpx", None)
+        with caplog.at_level("WARNING", logger="src.qgenda_client"):
+            c = QGendaClient(api_key="key", company_key="company", http2=True)
+        assert c._client is c.session
+        assert "httpx not installed" in caplog.text
+        monkeypatch.setattr(
+            c.session, "get", lambda url, params=None, timeout=None: _Response([{"StaffKey": "s1"}])
+        )
+        assert c.get_staff() == [{"StaffKey": "s1"}]
+        c.close()
+
+    def test_falls_back_without_h2(self, monkeypatch, caplog):
+        def transport(**kwargs):
+            raise ImportError("Using http2=True, but the 'h2' package is not installed")
+
+        fake_httpx = SimpleNamespace(
+            Client=lambda **kwargs: pytest.fail("Client built without a transport"),
+            HTTPTransport=transport,
+            Limits=lambda **kwargs: None,
+        )
+        monkeypatch.setattr(qgenda_client, "httpx", fake_httpx)
+        with caplog.at_level("WARNING", logger="src.qgenda_client"):
+            c = QGendaClient(api_key="key", company_key="company", http2=True)
+        assert c._client is c.session
+        assert "h2 not installed" in caplog.text
+        c.close()
+
+    def test_client_mirrors_session_settings(self, monkeypatch):
+        """Timeout and retry budget carry over from the requests adapter to httpx"""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        seen = {}
+        real_transport = httpx.HTTPTransport
+
+        def transport(**kwargs):
+            seen.update(kwargs)
+            return real_transport(**kwargs)
+
+        monkeypatch.setattr(httpx, "HTTPTransport", transport)
+        c = QGendaClient(api_key="key", company_key="company", http2=True)
+        try:
+            assert isinstance(c._client, httpx.Client)
+            assert seen["http2"] is True
+            assert seen["retries"] == MAX_RETRIES == c.session.get_adapter("https://").max_retries.total
+            assert c._client.timeout == httpx.Timeout(REQUEST_TIMEOUT)
+            assert c._client.headers["Authorization"] == "Bearer key"
+        finally:
+            c.close()
+
+
+# ---------------------------------------------------------------------------
+# Streaming (ijson) vs response.json()
+# ---------------------------------------------------------------------------
+
+ENTRIES_BODY = json.dumps([
+    {"FirstName": "Alice", "LastName": "Ng", "Date": "2026-03-02", "Hours": 7.5, "Key": 12},
+    {"FirstName": "Zoë", "LastName": "O'Brien", "Date": "2026-03-02", "Hours": 1e1, "Notes": None},
+    {"FirstName": "Bob", "LastName": "Lee", "Date": "2026-03-04", "Tags": ["IR", {"Site": "PVH"}], "Open": False},
+]).encode()
+
+
+class TestStreamingEntries:
+
+    @pytest.fixture
+    def serve(self, client, monkeypatch):
+        """Serve ENTRIES_BODY from session.get; records whether it was streamed."""
+        calls = []
+
+        def get(url, params=None, timeout=None, stream=False):
+            calls.append(stream)
+            return _StreamedResponse(ENTRIES_BODY) if stream else _Response(json.loads(ENTRIES_BODY))
+
+        monkeypatch.setattr(client.session, "get", get)
+        return calls
+
+    def _entries(self, client):
+        return (
+            list(client.get_schedule_iter("2026-03-01", "2026-03-31")),
+            list(client.get_time_off_iter("2026-03-01", "2026-03-31")),
+            extract_vacation_data(client, "2026-03-01", "2026-03-31"),
+        )
+
+    def test_ijson_matches_response_json(self, client, serve, monkeypatch):
+        pytest.importorskip("ijson")
+        streamed = self._entries(client)
+        assert serve == [True, True, True]
+
+        monkeypatch.setattr(qgenda_client, "ijson", None)
+        serve.clear()
+        buffered = self._entries(client)
+        assert serve == [False, False, False]
+
+        assert streamed == buffered
+        expected = json.loads(ENTRIES_BODY)
+        assert streamed[0] == streamed[1] == expected
+        assert client.get_schedule("2026-03-01", "2026-03-31") == expected
+        assert [type(e.get("Hours")) for e in streamed[0]] == [float, float, type(None)]
+
+    def test_fallback_without_ijson(self, client, serve, monkeypatch):
+        monkeypatch.setattr(qgenda_client, "ijson", None)
+        schedule, time_off, vacation_map = self._entries(client)
+        assert serve == [False, False, False]
+        assert schedule == time_off == json.loads(ENTRIES_BODY)
+        assert vacation_map == {"2026-03-02": ["Alice Ng", "Zoë O'Brien"], "2026-03-04": ["Bob Lee"]}